@@ -6,6 +6,7 @@ Single source of truth for mathematical constants used in CFM.
 """
 
 import math
+import sys
 
 # Golden ratio
 PHI = 1.618033988749895
@@ -22,5 +23,13 @@ E = math.e
 # Tau (2*pi)
 TAU = 2.0 * PI
 
+# Inverse of PHI
+PHI_INV = 1.0 / PHI
+
 # Inverse of PSI
 PSI_INV = 1.0 / PSI
+
+# Keyword options for the package's dataclasses: slots=True is only
+# available on Python 3.10+; older interpreters fall back to a regular
+# __dict__-backed instance.
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -11,23 +11,95 @@ This implementation:
 - Contains no identity, semantic, or control logic
 """
 
-import math
-from typing import Dict, Any, Optional, List
-import sys
-import os
+from math import sin
+from typing import Dict, Any, Optional, List, Callable, MutableSequence, Tuple
 
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from cfm_consts import PHI, PSI, PI
+from cfm_consts import PHI, PHI_INV, TAU
 
 from .config import CFMCoreConfig
 from .state import CFMCoreState
 
 
-def _clamp01(value: float) -> float:
-    """Clamp a value to [0, 1]."""
-    return max(0.0, min(1.0, value))
+# Validated default state; new and reset cores get fast copies of it instead
+# of re-running the default factories and __post_init__ validation. Never
+# handed out directly.
+_DEFAULT_STATE = CFMCoreState()
+
+
+def _make_update_kernel(
+    config: CFMCoreConfig,
+) -> Callable[[float, float, float, float, float], Tuple[float, float, float, float]]:
+    """
+    Build the v0 state update kernel specialized to one configuration.
+
+    The configuration constants are bound once as closure variables, so
+    the returned function takes only the state values and dt and never
+    touches the config object on the per-step path. Batch and ensemble
+    stepping reuse the same kernel.
+
+    Args:
+        config: Validated core configuration
+
+    Returns:
+        Function mapping (coherence, instability, energy, phase, dt) to
+        the updated (coherence, instability, energy, phase)
+    """
+    omega_base = config.omega_base
+    energy_target = config.energy_target
+    instability_base = config.instability_base
+    energy_tau = config._energy_tau
+    instability_tau = config._instability_tau
+
+    def update_state_kernel(
+        coherence: float,
+        instability: float,
+        energy: float,
+        phase: float,
+        dt: float,
+    ) -> Tuple[float, float, float, float]:
+        """Advance the v0 field variables by one (already clamped) dt."""
+        # Phase evolution (wraps at 1.0). A single subtraction is exact
+        # and covers every step with dt * omega_base < 1; larger configured
+        # steps fall back to the modulo.
+        phase += dt * omega_base
+        if phase >= 1.0:
+            phase = phase - 1.0 if phase < 2.0 else phase % 1.0
+
+        # Energy dynamics: relaxation toward attractor
+        # dE/dt = (E_target - E) / tau_energy
+        energy_delta = dt * (energy_target - energy) / energy_tau
+        energy += energy_delta
+        energy = 0.0 if energy <= 0.0 else (1.0 if energy >= 1.0 else energy)
+
+        # Instability dynamics: driven oscillation with decay
+        # dI/dt = (I_base * sin(2*pi * phase) - I) / tau_instability
+        phase_angle = TAU * phase
+        instability_drive = instability_base * sin(phase_angle)
+        instability_delta = dt * (
+            instability_drive - instability
+        ) / instability_tau
+        instability += instability_delta
+        instability = (
+            0.0 if instability <= 0.0
+            else (1.0 if instability >= 1.0 else instability)
+        )
+
+        # Coherence dynamics: coupled to energy and stability
+        # C = (1 - I) * E^(1/phi)
+        # energy was clamped to [0, 1] above, so no max(0, ...) guard is needed
+        energy_factor = energy ** PHI_INV
+        target_coherence = (1.0 - instability) * energy_factor
+
+        # Smooth transition toward target
+        coherence_delta = dt * (target_coherence - coherence) / PHI
+        coherence += coherence_delta
+        coherence = (
+            0.0 if coherence <= 0.0 else (1.0 if coherence >= 1.0 else coherence)
+        )
+
+        return coherence, instability, energy, phase
+
+    return update_state_kernel
 
 
 class CFMCore:
@@ -65,7 +137,9 @@ class CFMCore:
             initial_state: Initial state (uses defaults if None)
         """
         self.config = config or CFMCoreConfig()
-        self._state = initial_state.copy() if initial_state else CFMCoreState()
+        self._state = initial_state.copy() if initial_state else _DEFAULT_STATE._copy_fast()
+        self._kernel_config = self.config
+        self._update_kernel = _make_update_kernel(self.config)
 
     def step(
         self,
@@ -94,17 +168,8 @@ class CFMCore:
             - No identity information in output
             - Deterministic for same state + dt
         """
-        # Clamp dt to safe range
-        dt = max(0.0, min(dt, self.config.max_dt))
-
-        # Update internal state
-        self._update_state(dt)
-
-        # Compute output values
-        coherence = self._state.coherence
-        stability = 1.0 - self._state.instability
-        intensity = self._state.energy
-        alignment = _clamp01((coherence + stability) / 2.0)
+        coherence, stability, intensity, alignment = self._advance(dt)
+        state = self._state
 
         # Return protocol-compliant output
         return {
@@ -114,12 +179,121 @@ class CFMCore:
             "intensity": intensity,
             "alignment": alignment,
             # Metadata (safe to include)
-            "cfm_time": self._state.time,
-            "cfm_step": self._state.step_count,
-            "cfm_phase": self._state.phase,
+            "cfm_time": state.time,
+            "cfm_step": state.step_count,
+            "cfm_phase": state.phase,
             # No identity / semantic / control fields
         }
 
+    def step_into(
+        self,
+        out: MutableSequence[float],
+        human_messages: Optional[List[str]] = None,
+        external_events: Optional[Dict[str, Any]] = None,
+        dt: float = 1.0,
+    ) -> None:
+        """
+        Execute one CFM core step, writing outputs into a caller buffer.
+
+        Same dynamics as step(), but no result dict is allocated: the
+        required outputs are written to out[0:4] in the order coherence,
+        stability, intensity, alignment. Metadata is available through
+        get_state().
+
+        Args:
+            out: Mutable sequence with at least four slots
+            human_messages: Ignored (no semantic processing)
+            external_events: Ignored (pure internal dynamics)
+            dt: Time delta since last step (clamped to [0, max_dt])
+        """
+        out[0], out[1], out[2], out[3] = self._advance(dt)
+
+    def step_many(self, n_steps: int, dt: float = 1.0) -> Dict[str, List[float]]:
+        """
+        Execute several CFM core steps with a fixed dt.
+
+        Equivalent to calling step(dt=dt) n_steps times, but returns the
+        output trajectories as parallel lists instead of building one
+        dict per step.
+
+        Args:
+            n_steps: Number of steps to execute
+            dt: Time delta per step (clamped to [0, max_dt])
+
+        Returns:
+            Dict mapping coherence, stability, intensity, alignment to
+            lists of n_steps values, all bounded in [0, 1].
+        """
+        # Clamp dt to safe range
+        dt = max(0.0, min(dt, self.config.max_dt))
+
+        state = self._state
+        update_state_kernel = self._get_update_kernel()
+
+        coherence = state.coherence
+        instability = state.instability
+        energy = state.energy
+        phase = state.phase
+        time = state.time
+
+        coherence_out: List[float] = []
+        stability_out: List[float] = []
+        intensity_out: List[float] = []
+        alignment_out: List[float] = []
+
+        for _ in range(n_steps):
+            time += dt
+            coherence, instability, energy, phase = update_state_kernel(
+                coherence, instability, energy, phase, dt
+            )
+            stability = 1.0 - instability
+            coherence_out.append(coherence)
+            stability_out.append(stability)
+            intensity_out.append(energy)
+            alignment = (coherence + stability) / 2.0
+            alignment_out.append(
+                0.0 if alignment <= 0.0 else (1.0 if alignment >= 1.0 else alignment)
+            )
+
+        state.coherence = coherence
+        state.instability = instability
+        state.energy = energy
+        state.phase = phase
+        state.time = time
+        state.step_count += len(coherence_out)
+
+        return {
+            "coherence": coherence_out,
+            "stability": stability_out,
+            "intensity": intensity_out,
+            "alignment": alignment_out,
+        }
+
+    def _advance(self, dt: float) -> Tuple[float, float, float, float]:
+        """
+        Clamp dt, update internal state and compute the output values.
+
+        Args:
+            dt: Requested time delta
+
+        Returns:
+            Tuple of (coherence, stability, intensity, alignment)
+        """
+        # Clamp dt to safe range
+        dt = max(0.0, min(dt, self.config.max_dt))
+
+        # Update internal state
+        self._update_state(dt)
+
+        # Compute output values
+        coherence = self._state.coherence
+        stability = 1.0 - self._state.instability
+        intensity = self._state.energy
+        alignment = (coherence + stability) / 2.0
+        alignment = 0.0 if alignment <= 0.0 else (1.0 if alignment >= 1.0 else alignment)
+
+        return coherence, stability, intensity, alignment
+
     def _update_state(self, dt: float) -> None:
         """
         Update internal state using phi/psi-based dynamics.
@@ -127,46 +301,36 @@ class CFMCore:
         Args:
             dt: Time delta (already clamped)
         """
-        # Increment counters
-        self._state.time += dt
-        self._state.step_count += 1
+        state = self._state
 
-        # Phase evolution (wraps at 1.0)
-        phase_delta = dt * self.config.omega_base
-        self._state.phase = (self._state.phase + phase_delta) % 1.0
-
-        # Energy dynamics: relaxation toward attractor
-        # dE/dt = (E_target - E) / tau_energy
-        energy_delta = dt * (
-            self.config.energy_target - self._state.energy
-        ) / (self.config.tau_energy * PHI)
-        self._state.energy = _clamp01(self._state.energy + energy_delta)
-
-        # Instability dynamics: driven oscillation with decay
-        # dI/dt = (I_base * sin(2*pi * phase) - I) / tau_instability
-        phase_angle = 2.0 * PI * self._state.phase
-        instability_drive = self.config.instability_base * math.sin(phase_angle)
-        instability_delta = dt * (
-            instability_drive - self._state.instability
-        ) / (self.config.tau_instability / PSI)
-        self._state.instability = _clamp01(
-            self._state.instability + instability_delta
+        # Increment counters
+        state.time += dt
+        state.step_count += 1
+
+        (
+            state.coherence,
+            state.instability,
+            state.energy,
+            state.phase,
+        ) = self._get_update_kernel()(
+            state.coherence, state.instability, state.energy, state.phase, dt
         )
 
-        # Coherence dynamics: coupled to energy and stability
-        # C = (1 - I) * E^(1/phi)
-        energy_factor = math.pow(
-            max(0.0, self._state.energy), 1.0 / PHI
-        )
-        target_coherence = (1.0 - self._state.instability) * energy_factor
+    def _get_update_kernel(
+        self,
+    ) -> Callable[[float, float, float, float, float], Tuple[float, float, float, float]]:
+        """
+        Return the update kernel for the current config.
 
-        # Smooth transition toward target
-        coherence_delta = dt * (
-            target_coherence - self._state.coherence
-        ) / PHI
-        self._state.coherence = _clamp01(
-            self._state.coherence + coherence_delta
-        )
+        The kernel is rebuilt if the config object has been replaced.
+
+        Returns:
+            Specialized update kernel (see _make_update_kernel)
+        """
+        if self._kernel_config is not self.config:
+            self._kernel_config = self.config
+            self._update_kernel = _make_update_kernel(self.config)
+        return self._update_kernel
 
     def reset(self, initial_state: Optional[CFMCoreState] = None) -> None:
         """
@@ -175,7 +339,7 @@ class CFMCore:
         Args:
             initial_state: State to reset to (uses defaults if None)
         """
-        self._state = initial_state.copy() if initial_state else CFMCoreState()
+        self._state = initial_state.copy() if initial_state else _DEFAULT_STATE._copy_fast()
 
     def get_state(self) -> CFMCoreState:
         """
@@ -184,7 +348,8 @@ class CFMCore:
         Returns:
             Copy of internal state
         """
-        return self._state.copy()
+        # The internal state is always valid, so skip re-validation
+        return self._state._copy_fast()
 
     def get_status(self) -> Dict[str, Any]:
         """
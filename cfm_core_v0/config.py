@@ -7,16 +7,12 @@ All default values are derived from phi, psi, or simple fractions thereof.
 """
 
 from dataclasses import dataclass, field
-import sys
-import os
+from typing import Optional
 
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cfm_consts import PHI, PSI, DATACLASS_OPTIONS
 
-from cfm_consts import PHI, PSI
 
-
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class CFMCoreConfig:
     """
     Configuration for CFM Core v0.
@@ -31,6 +27,9 @@ class CFMCoreConfig:
         energy_target: Energy attractor value (default: 1/phi)
         instability_base: Base instability amplitude (default: 1/(2*phi))
         max_dt: Maximum allowed time step (default: 1.0)
+
+    The effective (phi/psi-scaled) time constants are computed once in
+    __post_init__ so the update kernel divides by a single stored value.
     """
 
     # Time constants (phi-scaled)
@@ -45,35 +44,68 @@ class CFMCoreConfig:
     # Bounds
     max_dt: float = 1.0
 
+    # Effective time constants (set in __post_init__)
+    _energy_tau: float = field(init=False, repr=False, compare=False)
+    _instability_tau: float = field(init=False, repr=False, compare=False)
+
+    # to_dict() result, built on first call (the config is frozen)
+    _dict_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
-        """Validate configuration after initialization."""
+        """
+        Validate configuration after initialization.
+
+        The dataclass is frozen, so corrections and derived time constants are
+        written with object.__setattr__.
+        """
         # Ensure positive time constants
         if self.tau_energy <= 0:
-            self.tau_energy = PHI
+            object.__setattr__(self, "tau_energy", PHI)
         if self.tau_instability <= 0:
-            self.tau_instability = PHI * PHI
+            object.__setattr__(self, "tau_instability", PHI * PHI)
 
         # Ensure omega_base is positive
         if self.omega_base <= 0:
-            self.omega_base = 1.0 / PHI
+            object.__setattr__(self, "omega_base", 1.0 / PHI)
 
         # Ensure energy_target is in [0, 1]
-        self.energy_target = max(0.0, min(1.0, self.energy_target))
+        object.__setattr__(
+            self, "energy_target", max(0.0, min(1.0, self.energy_target))
+        )
 
         # Ensure instability_base is in [0, 0.5]
-        self.instability_base = max(0.0, min(0.5, self.instability_base))
+        object.__setattr__(
+            self, "instability_base", max(0.0, min(0.5, self.instability_base))
+        )
 
         # Ensure max_dt is positive
         if self.max_dt <= 0:
-            self.max_dt = 1.0
+            object.__setattr__(self, "max_dt", 1.0)
+
+        # Effective time constants used by the update kernel
+        object.__setattr__(self, "_energy_tau", self.tau_energy * PHI)
+        object.__setattr__(self, "_instability_tau", self.tau_instability / PSI)
 
     def to_dict(self) -> dict:
         """
         Convert configuration to dictionary.
 
+        The mapping is built once per instance and cached; each call
+        returns a fresh shallow copy the caller may modify.
+
         Returns:
             Configuration as dict
         """
+        cache = self._dict_cache
+        if cache is None:
+            cache = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cache)
+        return cache.copy()
+
+    def _build_dict(self) -> dict:
+        """Build the to_dict() mapping from the current field values."""
         return {
             "tau_energy": self.tau_energy,
             "tau_instability": self.tau_instability,
@@ -7,14 +7,9 @@ Contains the internal continuous variables that evolve over time.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any
-import sys
-import os
+from typing import Dict, Any, List, Optional, Sequence
 
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from cfm_consts import PHI
+from cfm_consts import PHI, DATACLASS_OPTIONS
 
 
 def _clamp01(value: float) -> float:
@@ -22,7 +17,7 @@ def _clamp01(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CFMCoreState:
     """
     Internal state of CFM Core v0.
@@ -74,6 +69,25 @@ class CFMCoreState:
             step_count=self.step_count,
         )
 
+    def _copy_fast(self) -> "CFMCoreState":
+        """
+        Copy the state without re-running __post_init__ validation.
+
+        Only for states already known to be valid, such as a core's own
+        internal state; use copy() for externally supplied states.
+
+        Returns:
+            New CFMCoreState with same values
+        """
+        state = object.__new__(CFMCoreState)
+        state.coherence = self.coherence
+        state.instability = self.instability
+        state.energy = self.energy
+        state.phase = self.phase
+        state.time = self.time
+        state.step_count = self.step_count
+        return state
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert state to dictionary.
@@ -110,6 +124,62 @@ class CFMCoreState:
             step_count=data.get("step_count", 0),
         )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        coherence: Sequence[float],
+        instability: Sequence[float],
+        energy: Sequence[float],
+        phase: Sequence[float],
+        time: Optional[Sequence[float]] = None,
+        step_count: Optional[Sequence[int]] = None,
+    ) -> List["CFMCoreState"]:
+        """
+        Create a batch of states from per-field sequences.
+
+        Applies the same validation as __post_init__ in one pass without
+        the per-instance constructor overhead, e.g. for Monte-Carlo
+        ensemble initialization.
+
+        Args:
+            coherence: Coherence values, one per state
+            instability: Instability values, one per state
+            energy: Energy values, one per state
+            phase: Phase values, one per state
+            time: Optional accumulated times (default: all 0.0)
+            step_count: Optional step counts (default: all 0)
+
+        Returns:
+            List of new CFMCoreState, one per index
+
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        size = len(coherence)
+        if time is None:
+            time = [0.0] * size
+        if step_count is None:
+            step_count = [0] * size
+        if not (
+            len(instability) == len(energy) == len(phase)
+            == len(time) == len(step_count) == size
+        ):
+            raise ValueError("All field sequences must have the same length")
+
+        new = object.__new__
+        states = []
+        rows = zip(coherence, instability, energy, phase, time, step_count)
+        for c, i, e, p, t, s in rows:
+            state = new(cls)
+            state.coherence = max(0.0, min(1.0, c))
+            state.instability = max(0.0, min(1.0, i))
+            state.energy = max(0.0, min(1.0, e))
+            state.phase = p % 1.0
+            state.time = max(0.0, t)
+            state.step_count = max(0, s)
+            states.append(state)
+        return states
+
     def validate(self) -> bool:
         """
         Check if state is valid.
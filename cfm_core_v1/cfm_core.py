@@ -17,32 +17,229 @@ This implementation:
 - Contains no identity, semantic, or control logic
 """
 
-import math
-from typing import Dict, Any, Optional, List
-import sys
-import os
+from math import sin
+from typing import Dict, Any, Optional, List, Callable, MutableSequence, Tuple
 
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from cfm_consts import PHI, PSI, PI
+from cfm_consts import PHI, PHI_INV, PSI, TAU
 
 from .config import CFMCoreV1Config
 from .state import CFMCoreV1State
 
 
-def _clamp01(value: float) -> float:
-    """Clamp a value to [0, 1]."""
-    return max(0.0, min(1.0, value))
+# Validated default state; new and reset cores get fast copies of it instead
+# of re-running the default factories and __post_init__ validation. Never
+# handed out directly.
+_DEFAULT_STATE = CFMCoreV1State()
 
 
-def _smooth_step(x: float, edge0: float = 0.0, edge1: float = 1.0) -> float:
+def _make_update_kernel(
+    config: CFMCoreV1Config,
+) -> Callable[..., Tuple[float, float, float, float, float, float]]:
     """
-    Smooth step function (Hermite interpolation).
-    Returns 0 for x <= edge0, 1 for x >= edge1, smooth transition between.
+    Build the v1 state update kernel specialized to one configuration.
+
+    The configuration constants are bound once as closure variables, so
+    the returned function takes only the state values and dt and never
+    touches the config object on the per-step path. Batch and ensemble
+    stepping reuse the same kernel.
+
+    Args:
+        config: Validated core configuration
+
+    Returns:
+        Function mapping (coherence, instability, energy, phase,
+        coherence_baseline, alignment_phase, dt) to the updated
+        (coherence, instability, energy, phase, coherence_baseline,
+        alignment_phase)
     """
-    x = _clamp01((x - edge0) / (edge1 - edge0))
-    return x * x * (3.0 - 2.0 * x)
+    omega_phase = config.omega_phase
+    coherence_target = config.coherence_target
+    energy_target = config.energy_target
+    coherence_decay_rate = config.coherence_decay_rate
+    instability_base = config.instability_base
+    tau_coherence = config.tau_coherence
+    tau_energy = config.tau_energy
+    tau_instability = config.tau_instability
+    baseline_tau = config._baseline_tau
+
+    def update_state_kernel(
+        coherence: float,
+        instability: float,
+        energy: float,
+        phase: float,
+        coherence_baseline: float,
+        alignment_phase: float,
+        dt: float,
+    ) -> Tuple[float, float, float, float, float, float]:
+        """Advance the v1 field variables by one (already clamped) dt."""
+        # === FAST VARIABLES ===
+
+        # Phase evolution (fast, wraps at 1.0). A single subtraction is
+        # exact and covers every step with dt * omega_phase < 1; larger
+        # configured steps fall back to the modulo.
+        phase_step = dt * omega_phase
+        phase += phase_step
+        if phase >= 1.0:
+            phase = phase - 1.0 if phase < 2.0 else phase % 1.0
+
+        # Alignment phase evolution (slightly different frequency for
+        # resonance patterns). Reuses phase_step, which rounds exactly
+        # like dt * omega_phase * PSI evaluated left to right.
+        alignment_phase += phase_step * PSI
+        if alignment_phase >= 1.0:
+            alignment_phase = (
+                alignment_phase - 1.0 if alignment_phase < 2.0
+                else alignment_phase % 1.0
+            )
+
+        # Instability dynamics (fast, sinusoidal drive with decay)
+        # Uses smoother dynamics than v0 for regime-like behavior
+        phase_angle = TAU * phase
+        instability_drive = instability_base * (
+            0.5 + 0.5 * sin(phase_angle)  # Always positive, smoother
+        )
+
+        # Instability decays toward drive value
+        instability_delta = dt * (instability_drive - instability) / tau_instability
+        instability += instability_delta
+        instability = (
+            0.0 if instability <= 0.0
+            else (1.0 if instability >= 1.0 else instability)
+        )
+
+        # === SLOW VARIABLES ===
+
+        # Energy dynamics: slow relaxation toward attractor
+        energy_delta = dt * (energy_target - energy) / tau_energy
+        energy += energy_delta
+        energy = 0.0 if energy <= 0.0 else (1.0 if energy >= 1.0 else energy)
+
+        # Coherence baseline: very slow drift toward target
+        # This provides the "slowly-charging capacitor" behavior
+        baseline_delta = dt * (
+            coherence_target - coherence_baseline
+        ) / baseline_tau
+        coherence_baseline += baseline_delta
+        coherence_baseline = (
+            0.0 if coherence_baseline <= 0.0
+            else (1.0 if coherence_baseline >= 1.0 else coherence_baseline)
+        )
+
+        # Coherence dynamics: follows baseline but is affected by instability
+        # Under stable conditions: drift upward toward baseline
+        # Under instability: decay
+        stability_factor = 1.0 - instability
+        target_coherence = coherence_baseline * stability_factor
+
+        # Energy also contributes to coherence (like v0, but slower)
+        # energy was clamped to [0, 1] above, so no max(0, ...) guard is needed
+        energy_contribution = energy ** PHI_INV
+        target_coherence *= energy_contribution
+        target_coherence = (
+            0.0 if target_coherence <= 0.0
+            else (1.0 if target_coherence >= 1.0 else target_coherence)
+        )
+
+        # Smooth transition toward target
+        if target_coherence > coherence:
+            # Building coherence (slow)
+            coherence_delta = dt * (target_coherence - coherence) / tau_coherence
+        else:
+            # Decaying coherence (faster, scaled by instability)
+            decay_rate = coherence_decay_rate * (1.0 + instability)
+            coherence_delta = dt * (
+                target_coherence - coherence
+            ) * decay_rate / tau_coherence
+
+        coherence += coherence_delta
+        coherence = (
+            0.0 if coherence <= 0.0 else (1.0 if coherence >= 1.0 else coherence)
+        )
+
+        return (
+            coherence,
+            instability,
+            energy,
+            phase,
+            coherence_baseline,
+            alignment_phase,
+        )
+
+    return update_state_kernel
+
+
+def _compute_outputs_kernel(
+    coherence: float,
+    instability: float,
+    energy: float,
+    phase: float,
+    alignment_phase: float,
+    stability_baseline: float,
+    intensity_coherence_coupling: float,
+    alignment_lock_strength: float,
+) -> Tuple[float, float, float, float]:
+    """
+    Compute the four v1 outputs from the (already updated) state.
+
+    Args:
+        coherence, instability, energy, phase, alignment_phase: State values
+        stability_baseline, intensity_coherence_coupling,
+        alignment_lock_strength: Configuration constants
+
+    Returns:
+        Tuple of (coherence, stability, intensity, alignment), all in [0, 1]
+    """
+    # --- Stability: regime-like behavior ---
+    # Base stability is inverse of instability
+    base_stability = 1.0 - instability
+
+    # High stability tends to stay high (stable band);
+    # below baseline the full instability effect is visible
+    if base_stability > stability_baseline:
+        stability = base_stability * 0.9 + stability_baseline * 0.1
+    else:
+        stability = base_stability
+    stability = 0.0 if stability <= 0.0 else (1.0 if stability >= 1.0 else stability)
+
+    # --- Intensity: baseline (from energy) + coherence modulation ---
+    coherence_boost = coherence * intensity_coherence_coupling
+
+    # Small phase-locked variation for "activation" pattern
+    activation = 0.05 * (1.0 + sin(TAU * phase * PHI)) * coherence
+
+    intensity = energy + coherence_boost + activation
+    intensity = 0.0 if intensity <= 0.0 else (1.0 if intensity >= 1.0 else intensity)
+
+    # --- Alignment: resonance-like lock-in ---
+    base_alignment = (coherence + stability) / 2.0
+
+    # Lock-in potential is high when both coherence and stability are high
+    lock_in_potential = coherence * stability
+
+    # Lock-in threshold: above this, alignment stabilizes
+    threshold = alignment_lock_strength
+
+    if lock_in_potential > threshold:
+        # Lock-in regime: alignment tends toward high stable value
+        # The stronger lock_in_potential, the more stable
+        # Smooth step (Hermite interpolation) from threshold to 1. In this
+        # branch lock_in_potential > threshold, so only the upper clamp
+        # can apply.
+        lock_strength = (lock_in_potential - threshold) / (1.0 - threshold)
+        if lock_strength >= 1.0:
+            lock_strength = 1.0
+        lock_strength = lock_strength * lock_strength * (3.0 - 2.0 * lock_strength)
+        target = threshold + (1.0 - threshold) * lock_strength
+        alignment = base_alignment * (1.0 - lock_strength) + target * lock_strength
+    else:
+        # Drift regime: alignment varies with phase
+        alignment_angle = TAU * alignment_phase
+        drift = 0.1 * sin(alignment_angle) * (1.0 - lock_in_potential)
+        alignment = base_alignment + drift
+
+    alignment = 0.0 if alignment <= 0.0 else (1.0 if alignment >= 1.0 else alignment)
+
+    return coherence, stability, intensity, alignment
 
 
 class CFMCoreV1:
@@ -80,7 +277,9 @@ class CFMCoreV1:
             initial_state: Initial state (uses defaults if None)
         """
         self.config = config or CFMCoreV1Config()
-        self._state = initial_state.copy() if initial_state else CFMCoreV1State()
+        self._state = initial_state.copy() if initial_state else _DEFAULT_STATE._copy_fast()
+        self._kernel_config = self.config
+        self._update_kernel = _make_update_kernel(self.config)
 
     def step(
         self,
@@ -109,17 +308,8 @@ class CFMCoreV1:
             - No identity information in output
             - Deterministic for same state + dt
         """
-        # Clamp dt to safe range
-        dt = max(0.0, min(dt, self.config.max_dt))
-
-        # Update internal state
-        self._update_state(dt)
-
-        # Compute output values
-        coherence = self._state.coherence
-        stability = self._compute_stability()
-        intensity = self._compute_intensity()
-        alignment = self._compute_alignment(coherence, stability)
+        coherence, stability, intensity, alignment = self._advance(dt)
+        state = self._state
 
         # Return protocol-compliant output
         return {
@@ -129,180 +319,203 @@ class CFMCoreV1:
             "intensity": intensity,
             "alignment": alignment,
             # Metadata (safe to include)
-            "cfm_time": self._state.time,
-            "cfm_step": self._state.step_count,
-            "cfm_phase": self._state.phase,
+            "cfm_time": state.time,
+            "cfm_step": state.step_count,
+            "cfm_phase": state.phase,
             "cfm_version": 1,
             # No identity / semantic / control fields
         }
 
-    def _update_state(self, dt: float) -> None:
+    def step_into(
+        self,
+        out: MutableSequence[float],
+        human_messages: Optional[List[str]] = None,
+        external_events: Optional[Dict[str, Any]] = None,
+        dt: float = 1.0,
+    ) -> None:
         """
-        Update internal state using v1 dynamics.
+        Execute one CFM core step, writing outputs into a caller buffer.
 
-        Implements slow/fast variable separation:
-        - Fast: phase, instability (quick oscillations)
-        - Slow: coherence, energy, coherence_baseline (gradual drift)
+        Same dynamics as step(), but no result dict is allocated: the
+        required outputs are written to out[0:4] in the order coherence,
+        stability, intensity, alignment. Metadata is available through
+        get_state().
 
         Args:
-            dt: Time delta (already clamped)
+            out: Mutable sequence with at least four slots
+            human_messages: Ignored (no semantic processing)
+            external_events: Ignored (pure internal dynamics)
+            dt: Time delta since last step (clamped to [0, max_dt])
         """
-        # Increment counters
-        self._state.time += dt
-        self._state.step_count += 1
-
-        # === FAST VARIABLES ===
-
-        # Phase evolution (fast, wraps at 1.0)
-        phase_delta = dt * self.config.omega_phase
-        self._state.phase = (self._state.phase + phase_delta) % 1.0
-
-        # Alignment phase evolution (slightly different frequency for resonance patterns)
-        alignment_phase_delta = dt * self.config.omega_phase * PSI
-        self._state.alignment_phase = (
-            self._state.alignment_phase + alignment_phase_delta
-        ) % 1.0
-
-        # Instability dynamics (fast, sinusoidal drive with decay)
-        # Uses smoother dynamics than v0 for regime-like behavior
-        phase_angle = 2.0 * PI * self._state.phase
-        instability_drive = self.config.instability_base * (
-            0.5 + 0.5 * math.sin(phase_angle)  # Always positive, smoother
-        )
+        out[0], out[1], out[2], out[3] = self._advance(dt)
 
-        # Instability decays toward drive value
-        instability_delta = dt * (
-            instability_drive - self._state.instability
-        ) / self.config.tau_instability
-        self._state.instability = _clamp01(
-            self._state.instability + instability_delta
-        )
-
-        # === SLOW VARIABLES ===
+    def step_many(self, n_steps: int, dt: float = 1.0) -> Dict[str, List[float]]:
+        """
+        Execute several CFM core steps with a fixed dt.
 
-        # Energy dynamics: slow relaxation toward attractor
-        energy_delta = dt * (
-            self.config.energy_target - self._state.energy
-        ) / self.config.tau_energy
-        self._state.energy = _clamp01(self._state.energy + energy_delta)
+        Equivalent to calling step(dt=dt) n_steps times, but returns the
+        output trajectories as parallel lists instead of building one
+        dict per step.
 
-        # Coherence baseline: very slow drift toward target
-        # This provides the "slowly-charging capacitor" behavior
-        baseline_delta = dt * (
-            self.config.coherence_target - self._state.coherence_baseline
-        ) / (self.config.tau_coherence * PHI)
-        self._state.coherence_baseline = _clamp01(
-            self._state.coherence_baseline + baseline_delta
-        )
-
-        # Coherence dynamics: follows baseline but is affected by instability
-        # Under stable conditions: drift upward toward baseline
-        # Under instability: decay
-        stability_factor = 1.0 - self._state.instability
-        target_coherence = self._state.coherence_baseline * stability_factor
+        Args:
+            n_steps: Number of steps to execute
+            dt: Time delta per step (clamped to [0, max_dt])
 
-        # Energy also contributes to coherence (like v0, but slower)
-        energy_contribution = math.pow(max(0.0, self._state.energy), 1.0 / PHI)
-        target_coherence = _clamp01(target_coherence * energy_contribution)
+        Returns:
+            Dict mapping coherence, stability, intensity, alignment to
+            lists of n_steps values, all bounded in [0, 1].
+        """
+        # Clamp dt to safe range
+        dt = max(0.0, min(dt, self.config.max_dt))
 
-        # Smooth transition toward target
-        if target_coherence > self._state.coherence:
-            # Building coherence (slow)
-            coherence_delta = dt * (
-                target_coherence - self._state.coherence
-            ) / self.config.tau_coherence
-        else:
-            # Decaying coherence (faster, scaled by instability)
-            decay_rate = self.config.coherence_decay_rate * (
-                1.0 + self._state.instability
+        state = self._state
+        config = self.config
+        update_state_kernel = self._get_update_kernel()
+        stability_baseline = config.stability_baseline
+        intensity_coherence_coupling = config.intensity_coherence_coupling
+        alignment_lock_strength = config.alignment_lock_strength
+
+        coherence = state.coherence
+        instability = state.instability
+        energy = state.energy
+        phase = state.phase
+        coherence_baseline = state.coherence_baseline
+        alignment_phase = state.alignment_phase
+        time = state.time
+
+        coherence_out: List[float] = []
+        stability_out: List[float] = []
+        intensity_out: List[float] = []
+        alignment_out: List[float] = []
+
+        for _ in range(n_steps):
+            time += dt
+            (
+                coherence,
+                instability,
+                energy,
+                phase,
+                coherence_baseline,
+                alignment_phase,
+            ) = update_state_kernel(
+                coherence,
+                instability,
+                energy,
+                phase,
+                coherence_baseline,
+                alignment_phase,
+                dt,
             )
-            coherence_delta = dt * (
-                target_coherence - self._state.coherence
-            ) * decay_rate / self.config.tau_coherence
+            _, stability, intensity, alignment = _compute_outputs_kernel(
+                coherence,
+                instability,
+                energy,
+                phase,
+                alignment_phase,
+                stability_baseline,
+                intensity_coherence_coupling,
+                alignment_lock_strength,
+            )
+            coherence_out.append(coherence)
+            stability_out.append(stability)
+            intensity_out.append(intensity)
+            alignment_out.append(alignment)
+
+        state.coherence = coherence
+        state.instability = instability
+        state.energy = energy
+        state.phase = phase
+        state.coherence_baseline = coherence_baseline
+        state.alignment_phase = alignment_phase
+        state.time = time
+        state.step_count += len(coherence_out)
 
-        self._state.coherence = _clamp01(
-            self._state.coherence + coherence_delta
-        )
+        return {
+            "coherence": coherence_out,
+            "stability": stability_out,
+            "intensity": intensity_out,
+            "alignment": alignment_out,
+        }
 
-    def _compute_stability(self) -> float:
+    def _advance(self, dt: float) -> Tuple[float, float, float, float]:
         """
-        Compute stability output with regime-like behavior.
+        Clamp dt, update internal state and compute the output values.
+
+        Args:
+            dt: Requested time delta
 
         Returns:
-            Stability value in [0, 1]
+            Tuple of (coherence, stability, intensity, alignment)
         """
-        # Base stability is inverse of instability
-        base_stability = 1.0 - self._state.instability
-
-        # Apply smoothing to create regime-like behavior
-        # High stability tends to stay high (stable band)
-        # Low stability recovers gradually
-        if base_stability > self.config.stability_baseline:
-            # In stable regime: smooth toward baseline
-            return _clamp01(
-                base_stability * 0.9 + self.config.stability_baseline * 0.1
-            )
-        else:
-            # Below baseline: full instability effect visible
-            return _clamp01(base_stability)
+        # Clamp dt to safe range
+        dt = max(0.0, min(dt, self.config.max_dt))
 
-    def _compute_intensity(self) -> float:
-        """
-        Compute intensity output with coherence correlation.
+        # Update internal state
+        self._update_state(dt)
 
-        Intensity = baseline (from energy) + coherence modulation
+        # Compute output values
+        state = self._state
+        config = self.config
+        return _compute_outputs_kernel(
+            state.coherence,
+            state.instability,
+            state.energy,
+            state.phase,
+            state.alignment_phase,
+            config.stability_baseline,
+            config.intensity_coherence_coupling,
+            config.alignment_lock_strength,
+        )
 
-        Returns:
-            Intensity value in [0, 1]
+    def _update_state(self, dt: float) -> None:
         """
-        # Baseline from energy
-        baseline = self._state.energy
+        Update internal state using v1 dynamics.
 
-        # Coherence modulation: higher coherence enables higher intensity
-        coherence_boost = self._state.coherence * self.config.intensity_coherence_coupling
+        Implements slow/fast variable separation:
+        - Fast: phase, instability (quick oscillations)
+        - Slow: coherence, energy, coherence_baseline (gradual drift)
 
-        # Small phase-locked variation for "activation" pattern
-        phase_angle = 2.0 * PI * self._state.phase
-        activation = 0.05 * (1.0 + math.sin(phase_angle * PHI)) * self._state.coherence
+        Args:
+            dt: Time delta (already clamped)
+        """
+        state = self._state
 
-        return _clamp01(baseline + coherence_boost + activation)
+        # Increment counters
+        state.time += dt
+        state.step_count += 1
+
+        (
+            state.coherence,
+            state.instability,
+            state.energy,
+            state.phase,
+            state.coherence_baseline,
+            state.alignment_phase,
+        ) = self._get_update_kernel()(
+            state.coherence,
+            state.instability,
+            state.energy,
+            state.phase,
+            state.coherence_baseline,
+            state.alignment_phase,
+            dt,
+        )
 
-    def _compute_alignment(self, coherence: float, stability: float) -> float:
+    def _get_update_kernel(
+        self,
+    ) -> Callable[..., Tuple[float, float, float, float, float, float]]:
         """
-        Compute alignment output with resonance-like dynamics.
+        Return the update kernel for the current config.
 
-        Alignment exhibits lock-in behavior when coherence and stability are high.
-
-        Args:
-            coherence: Current coherence output
-            stability: Current stability output
+        The kernel is rebuilt if the config object has been replaced.
 
         Returns:
-            Alignment value in [0, 1]
+            Specialized update kernel (see _make_update_kernel)
         """
-        # Base alignment (like v0)
-        base_alignment = (coherence + stability) / 2.0
-
-        # Lock-in factor: how strongly conditions favor lock-in
-        # High when both coherence and stability are high
-        lock_in_potential = coherence * stability
-
-        # Lock-in threshold: above this, alignment stabilizes
-        threshold = self.config.alignment_lock_strength
-
-        if lock_in_potential > threshold:
-            # Lock-in regime: alignment tends toward high stable value
-            # The stronger lock_in_potential, the more stable
-            lock_strength = _smooth_step(lock_in_potential, threshold, 1.0)
-            target = threshold + (1.0 - threshold) * lock_strength
-            alignment = base_alignment * (1.0 - lock_strength) + target * lock_strength
-        else:
-            # Drift regime: alignment varies with phase
-            phase_angle = 2.0 * PI * self._state.alignment_phase
-            drift = 0.1 * math.sin(phase_angle) * (1.0 - lock_in_potential)
-            alignment = base_alignment + drift
-
-        return _clamp01(alignment)
+        if self._kernel_config is not self.config:
+            self._kernel_config = self.config
+            self._update_kernel = _make_update_kernel(self.config)
+        return self._update_kernel
 
     def reset(self, initial_state: Optional[CFMCoreV1State] = None) -> None:
         """
@@ -311,7 +524,7 @@ class CFMCoreV1:
         Args:
             initial_state: State to reset to (uses defaults if None)
         """
-        self._state = initial_state.copy() if initial_state else CFMCoreV1State()
+        self._state = initial_state.copy() if initial_state else _DEFAULT_STATE._copy_fast()
 
     def get_state(self) -> CFMCoreV1State:
         """
@@ -320,7 +533,8 @@ class CFMCoreV1:
         Returns:
             Copy of internal state
         """
-        return self._state.copy()
+        # The internal state is always valid, so skip re-validation
+        return self._state._copy_fast()
 
     def get_status(self) -> Dict[str, Any]:
         """
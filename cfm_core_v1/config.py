@@ -12,16 +12,12 @@ Key differences from v0:
 """
 
 from dataclasses import dataclass, field
-import sys
-import os
+from typing import Optional
 
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cfm_consts import PHI, PSI, DATACLASS_OPTIONS
 
-from cfm_consts import PHI, PSI
 
-
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class CFMCoreV1Config:
     """
     Configuration for CFM Core v1.
@@ -57,6 +53,9 @@ class CFMCoreV1Config:
 
         # Bounds
         max_dt: Maximum allowed time step (default: 1.0)
+
+    The phi-scaled baseline time constant is computed once in
+    __post_init__ so the update kernel divides by a single stored value.
     """
 
     # Slow variable time constants (larger = slower evolution)
@@ -83,44 +82,85 @@ class CFMCoreV1Config:
     # Bounds
     max_dt: float = 1.0
 
+    # Effective baseline time constant (set in __post_init__)
+    _baseline_tau: float = field(init=False, repr=False, compare=False)
+
+    # to_dict() result, built on first call (the config is frozen)
+    _dict_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
-        """Validate configuration after initialization."""
+        """
+        Validate configuration after initialization.
+
+        The dataclass is frozen, so corrections and the derived time
+        constant are written with object.__setattr__.
+        """
         # Ensure positive time constants
         if self.tau_coherence <= 0:
-            self.tau_coherence = PHI * PHI
+            object.__setattr__(self, "tau_coherence", PHI * PHI)
         if self.tau_energy <= 0:
-            self.tau_energy = PHI
+            object.__setattr__(self, "tau_energy", PHI)
         if self.tau_instability <= 0:
-            self.tau_instability = 1.0 / PHI
+            object.__setattr__(self, "tau_instability", 1.0 / PHI)
 
         # Ensure omega_phase is positive
         if self.omega_phase <= 0:
-            self.omega_phase = 1.0 / PHI
+            object.__setattr__(self, "omega_phase", 1.0 / PHI)
 
         # Ensure attractor values are in [0, 1]
-        self.coherence_target = max(0.0, min(1.0, self.coherence_target))
-        self.energy_target = max(0.0, min(1.0, self.energy_target))
-        self.stability_baseline = max(0.0, min(1.0, self.stability_baseline))
+        object.__setattr__(
+            self, "coherence_target", max(0.0, min(1.0, self.coherence_target))
+        )
+        object.__setattr__(
+            self, "energy_target", max(0.0, min(1.0, self.energy_target))
+        )
+        object.__setattr__(
+            self, "stability_baseline", max(0.0, min(1.0, self.stability_baseline))
+        )
 
         # Ensure coupling parameters are in reasonable ranges
-        self.coherence_decay_rate = max(0.0, min(2.0, self.coherence_decay_rate))
-        self.alignment_lock_strength = max(0.0, min(1.0, self.alignment_lock_strength))
-        self.intensity_coherence_coupling = max(0.0, min(0.5, self.intensity_coherence_coupling))
+        object.__setattr__(
+            self, "coherence_decay_rate", max(0.0, min(2.0, self.coherence_decay_rate))
+        )
+        object.__setattr__(
+            self, "alignment_lock_strength", max(0.0, min(1.0, self.alignment_lock_strength))
+        )
+        object.__setattr__(
+            self, "intensity_coherence_coupling", max(0.0, min(0.5, self.intensity_coherence_coupling))
+        )
 
         # Ensure instability_base is in [0, 0.5]
-        self.instability_base = max(0.0, min(0.5, self.instability_base))
+        object.__setattr__(
+            self, "instability_base", max(0.0, min(0.5, self.instability_base))
+        )
 
         # Ensure max_dt is positive
         if self.max_dt <= 0:
-            self.max_dt = 1.0
+            object.__setattr__(self, "max_dt", 1.0)
+
+        # Effective baseline time constant used by the update kernel
+        object.__setattr__(self, "_baseline_tau", self.tau_coherence * PHI)
 
     def to_dict(self) -> dict:
         """
         Convert configuration to dictionary.
 
+        The mapping is built once per instance and cached; each call
+        returns a fresh shallow copy the caller may modify.
+
         Returns:
             Configuration as dict
         """
+        cache = self._dict_cache
+        if cache is None:
+            cache = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cache)
+        return cache.copy()
+
+    def _build_dict(self) -> dict:
+        """Build the to_dict() mapping from the current field values."""
         return {
             "tau_coherence": self.tau_coherence,
             "tau_energy": self.tau_energy,
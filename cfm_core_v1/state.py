@@ -12,13 +12,8 @@ Key differences from v0:
 
 from dataclasses import dataclass, field
 from typing import Dict, Any
-import sys
-import os
 
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from cfm_consts import PHI
+from cfm_consts import PHI, DATACLASS_OPTIONS
 
 
 def _clamp01(value: float) -> float:
@@ -26,7 +21,7 @@ def _clamp01(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CFMCoreV1State:
     """
     Internal state of CFM Core v1.
@@ -97,6 +92,27 @@ class CFMCoreV1State:
             step_count=self.step_count,
         )
 
+    def _copy_fast(self) -> "CFMCoreV1State":
+        """
+        Copy the state without re-running __post_init__ validation.
+
+        Only for states already known to be valid, such as a core's own
+        internal state; use copy() for externally supplied states.
+
+        Returns:
+            New CFMCoreV1State with same values
+        """
+        state = object.__new__(CFMCoreV1State)
+        state.coherence = self.coherence
+        state.coherence_baseline = self.coherence_baseline
+        state.energy = self.energy
+        state.instability = self.instability
+        state.phase = self.phase
+        state.alignment_phase = self.alignment_phase
+        state.time = self.time
+        state.step_count = self.step_count
+        return state
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert state to dictionary.
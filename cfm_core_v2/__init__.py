@@ -29,15 +29,16 @@ Safety Guarantees:
 from .config import CFMCoreV2Config
 from .state import CFMCoreV2State
 from .cfm_core import CFMCoreV2
-from .presets import (
-    CFM_V2_PRESET_BASELINE,
-    CFM_V2_PRESET_HIGH_STABILITY,
-    CFM_V2_PRESET_HIGH_RESONANCE,
-    CFM_V2_PRESET_PULSED_ACTIVITY,
-    CFM_V2_PRESETS,
-    get_preset,
-    list_presets,
-)
+from . import presets as _presets
+from .presets import get_preset, list_presets
+
+
+def __getattr__(name):
+    """Resolve the preset constants lazily from the presets module."""
+    if name.startswith("CFM_V2_PRESET"):
+        return getattr(_presets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CFMCoreV2",
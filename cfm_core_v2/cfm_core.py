@@ -20,12 +20,7 @@ Safety Guarantees:
 """
 
 import math
-from typing import Dict, Any, Optional, List
-import sys
-import os
-
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Dict, Any, Optional, List, Callable, MutableSequence, Tuple
 
 from cfm_consts import PHI, PSI, PI
 
@@ -33,19 +28,290 @@ from .config import CFMCoreV2Config
 from .state import CFMCoreV2State
 
 
-def _clamp01(value: float) -> float:
-    """Clamp a value to [0, 1]."""
-    return max(0.0, min(1.0, value))
+# Validated default state; new and reset cores get fast copies of it instead
+# of re-running the default factories and __post_init__ validation. Never
+# handed out directly.
+_DEFAULT_STATE = CFMCoreV2State()
+
+
+# Resonance index weights (phi-scaled) and their normalizing sum
+_RESONANCE_WEIGHT_COHERENCE = 1.0 / PHI
+_RESONANCE_WEIGHT_ENERGY = 1.0 / (PHI ** 2)
+_RESONANCE_WEIGHT_STABILITY = 1.0 / (PHI ** 2)
+_RESONANCE_WEIGHT_PHASE = 1.0 / (PHI ** 3)
+_RESONANCE_NORM = 1.0 / PHI + 2.0 / (PHI ** 2) + 1.0 / (PHI ** 3)
+
+# Global/local weights of the phase modulation
+_PHASE_WEIGHT_GLOBAL = 1.0 / PHI
+_PHASE_WEIGHT_LOCAL = 1.0 - 1.0 / PHI
+
+# Pulse response gains per tier, applied to the pulse excess over the tier
+# threshold: (coherence_fast, energy_flux, alignment_field, coherence_slow).
+# A zero gain leaves that (already bounded) variable unchanged.
+_PULSE_RESPONSE_HIGH = (-0.1, 0.15, -0.08, -0.02)
+_PULSE_RESPONSE_MEDIUM = (-0.05, 0.08, -0.03, 0.0)
+_PULSE_RESPONSE_LOW = (-0.02, 0.0, 0.0, 0.0)
 
 
 def _smooth_step(x: float, edge0: float = 0.0, edge1: float = 1.0) -> float:
     """Smooth step function (Hermite interpolation)."""
     if edge1 == edge0:
         return 1.0 if x >= edge1 else 0.0
-    x = _clamp01((x - edge0) / (edge1 - edge0))
+    x = (x - edge0) / (edge1 - edge0)
+    x = 0.0 if x <= 0.0 else (1.0 if x >= 1.0 else x)
     return x * x * (3.0 - 2.0 * x)
 
 
+def _basin_attraction(x: float, mu: float, config: CFMCoreV2Config) -> float:
+    """Compute basin attraction force of the basin centered at mu."""
+    distance = abs(x - mu)
+    direction = 1.0 if mu > x else -1.0
+
+    if distance < config._basin_radius_inner:
+        return direction * config.basin_strength_inner * distance
+
+    if distance < config._basin_radius_outer:
+        return direction * config.basin_strength_outer
+
+    return 0.0
+
+
+def _make_update_kernel(config: CFMCoreV2Config) -> Callable[..., Tuple[float, ...]]:
+    """
+    Build the v2 state update kernel specialized to one configuration.
+
+    All eleven channel updates run in one function on local variables, in
+    the same order as the original per-channel helpers: phases, then the
+    fast, medium and slow channels, then the structured pulse response.
+    Configuration constants are bound once as closure variables.
+
+    Args:
+        config: Validated core configuration
+
+    Returns:
+        Function mapping the eleven state variables (in CFMCoreV2State field
+        order) and dt to their updated values
+    """
+    tau_fast = config.tau_fast
+    tau_very_fast = config.tau_very_fast
+    tau_medium = config.tau_medium
+    tau_slow = config.tau_slow
+    tau_very_slow = config.tau_very_slow
+    omega_global = config.omega_global
+    omega_local = config.omega_local
+    instability_base = config.instability_base
+    pulse_threshold_low = config.pulse_threshold_low
+    pulse_threshold_medium = config.pulse_threshold_medium
+    pulse_threshold_high = config.pulse_threshold_high
+    energy_target = config.energy_target
+    energy_dissipation = config.energy_dissipation
+    flux_damping = config.flux_damping
+    coherence_target = config.coherence_target
+    coherence_energy_coupling = config.coherence_energy_coupling
+    stability_target = config.stability_target
+    envelope_decay = config.envelope_decay
+    alignment_target = config.alignment_target
+    resonance_coupling = config.resonance_coupling
+    basin_center_c = config.basin_center_c
+    basin_center_e = config.basin_center_e
+    basin_center_s = config.basin_center_s
+
+    def update_state_kernel(
+        coherence_slow: float,
+        coherence_fast: float,
+        energy_potential: float,
+        energy_flux: float,
+        stability_envelope: float,
+        instability_pulse: float,
+        phase_global: float,
+        phase_local: float,
+        alignment_field: float,
+        alignment_direction: float,
+        resonance_index: float,
+        dt: float,
+    ) -> Tuple[float, ...]:
+        """Advance the v2 channels by one (already clamped) dt."""
+        prev_coherence_slow = coherence_slow
+
+        # --- Phases (very fast, fast) ---
+        # The local phase is modulated by the global phase before it
+        # advances. Phase deltas are non-negative, so a single subtraction
+        # is an exact wrap for any step below one full cycle; larger steps
+        # fall back to the modulo.
+        modulation = 1.0 + 0.2 * math.sin(2.0 * PI * phase_global)
+        phase_local += dt * omega_local * modulation / tau_very_fast
+        if phase_local >= 1.0:
+            phase_local = phase_local - 1.0 if phase_local < 2.0 else phase_local % 1.0
+
+        phase_global += dt * omega_global / tau_fast
+        if phase_global >= 1.0:
+            phase_global = phase_global - 1.0 if phase_global < 2.0 else phase_global % 1.0
+
+        # The pulse, phase modulation and flux all use the same raised
+        # sine of the updated global phase, in [0, 1]; evaluate it once
+        global_wave = 0.5 + 0.5 * math.sin(2.0 * PI * phase_global)
+
+        # --- Instability pulse (fast) ---
+        base_amplitude = instability_base * (1.0 - stability_envelope)
+        pulse_drive = base_amplitude * global_wave
+        threshold = stability_envelope * pulse_threshold_low
+        if pulse_drive > threshold:
+            target_pulse = pulse_drive
+        else:
+            target_pulse = pulse_drive * 0.3
+        value = instability_pulse + dt * (target_pulse - instability_pulse) / tau_fast
+        instability_pulse = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Fast coherence: tracks the slow channel under phase modulation ---
+        local_wave = 0.5 + 0.5 * math.sin(2.0 * PI * phase_local)
+        value = global_wave * _PHASE_WEIGHT_GLOBAL + local_wave * _PHASE_WEIGHT_LOCAL
+        phase_mod = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+        tracking_term = phase_mod * (coherence_slow - coherence_fast)
+        resonance_term = resonance_index * alignment_field * 0.1
+        value = coherence_fast + dt * (tracking_term + resonance_term) / tau_fast
+        coherence_fast = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Energy flux (fast) ---
+        gradient = abs(energy_potential - energy_target)
+        target_flux = gradient * global_wave
+        damping = flux_damping * energy_flux
+        value = energy_flux + dt * (target_flux - damping - energy_flux) / tau_fast
+        energy_flux = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Resonance index (medium): cross-channel correlation ---
+        if coherence_slow > 0.01:
+            coherence_ratio = coherence_fast / coherence_slow
+            coherence_correlation = 1.0 - abs(1.0 - coherence_ratio)
+        else:
+            coherence_correlation = 0.5
+
+        if energy_potential > 0.01:
+            energy_ratio = energy_flux / energy_potential
+            energy_correlation = 1.0 - abs(0.5 - energy_ratio)
+        else:
+            energy_correlation = 0.5
+
+        stability_correlation = 1.0 - instability_pulse * stability_envelope
+        phase_diff = abs(phase_global - phase_local)
+        phase_coherence = 1.0 - 2.0 * min(phase_diff, 1.0 - phase_diff)
+
+        target_resonance = (
+            coherence_correlation * _RESONANCE_WEIGHT_COHERENCE +
+            energy_correlation * _RESONANCE_WEIGHT_ENERGY +
+            stability_correlation * _RESONANCE_WEIGHT_STABILITY +
+            phase_coherence * _RESONANCE_WEIGHT_PHASE
+        )
+        value = target_resonance / _RESONANCE_NORM
+        target_resonance = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+        value = resonance_index + dt * (target_resonance - resonance_index) / tau_medium
+        resonance_index = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Alignment field (medium): pulled by the current lock-in ---
+        # Same formulas as the coherence and stability outputs, evaluated
+        # on the partially updated state
+        alpha = _smooth_step(stability_envelope, 0.3, 0.8)
+        value = alpha * coherence_slow + (1.0 - alpha) * coherence_fast
+        coherence_out = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+        value = (
+            stability_envelope
+            - instability_pulse * (1.0 - stability_envelope)
+            + resonance_index * 0.1
+        )
+        stability_out = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+        lock_in_potential = coherence_out * stability_out
+
+        target_attraction = lock_in_potential * (alignment_target - alignment_field)
+        direction_coupling = (
+            resonance_coupling *
+            (alignment_direction - 0.5) *
+            resonance_index
+        )
+        value = alignment_field + dt * (target_attraction + direction_coupling) / tau_medium
+        alignment_field = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Slow coherence ---
+        energy_factor = _smooth_step(energy_potential, 0.2, 0.8)
+        instability_effect = coherence_energy_coupling * instability_pulse
+        basin = _basin_attraction(coherence_slow, basin_center_c, config)
+        value = coherence_slow + dt * (
+            (coherence_target - coherence_slow) * energy_factor
+            - instability_effect
+            + basin
+        ) / tau_slow
+        coherence_slow = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Energy potential (slow) ---
+        dissipation = energy_flux * energy_dissipation
+        coherence_input = coherence_energy_coupling * prev_coherence_slow
+        basin = _basin_attraction(energy_potential, basin_center_e, config)
+        value = energy_potential + dt * (
+            (energy_target - energy_potential)
+            - dissipation
+            + coherence_input
+            + basin
+        ) / tau_slow
+        energy_potential = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Stability envelope (slow) ---
+        coherence_factor = _smooth_step(prev_coherence_slow, 0.3, 0.8)
+        target = stability_target * coherence_factor
+        alignment_decay = envelope_decay * (1.0 - alignment_field)
+        basin = _basin_attraction(stability_envelope, basin_center_s, config)
+        value = stability_envelope + dt * (
+            (target - stability_envelope) / tau_slow
+            - alignment_decay
+            + basin
+        )
+        stability_envelope = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Alignment direction (very slow) ---
+        stability_factor = _smooth_step(stability_envelope, 0.3, 0.8)
+        direction_drift = (basin_center_c - alignment_direction) * stability_factor
+        value = alignment_direction + dt * direction_drift / tau_very_slow
+        alignment_direction = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        # --- Structured pulse response ---
+        if instability_pulse > pulse_threshold_high:
+            threshold = pulse_threshold_high
+            response = _PULSE_RESPONSE_HIGH
+        elif instability_pulse > pulse_threshold_medium:
+            threshold = pulse_threshold_medium
+            response = _PULSE_RESPONSE_MEDIUM
+        elif instability_pulse > pulse_threshold_low:
+            threshold = pulse_threshold_low
+            response = _PULSE_RESPONSE_LOW
+        else:
+            response = None
+
+        if response is not None:
+            excess = instability_pulse - threshold
+            coherence_fast_gain, energy_flux_gain, alignment_field_gain, coherence_slow_gain = response
+            value = coherence_fast + coherence_fast_gain * excess
+            coherence_fast = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+            value = energy_flux + energy_flux_gain * excess
+            energy_flux = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+            value = alignment_field + alignment_field_gain * excess
+            alignment_field = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+            value = coherence_slow + coherence_slow_gain * excess
+            coherence_slow = 0.0 if value <= 0.0 else (1.0 if value >= 1.0 else value)
+
+        return (
+            coherence_slow,
+            coherence_fast,
+            energy_potential,
+            energy_flux,
+            stability_envelope,
+            instability_pulse,
+            phase_global,
+            phase_local,
+            alignment_field,
+            alignment_direction,
+            resonance_index,
+        )
+
+    return update_state_kernel
+
+
 class CFMCoreV2:
     """
     CFM Core v2 - Multi-channel numeric field dynamics system.
@@ -59,8 +325,10 @@ class CFMCoreV2:
         initial_state: Optional[CFMCoreV2State] = None,
     ):
         """Initialize CFM Core v2."""
-        self.config = config or CFMCoreV2Config()
-        self._state = initial_state.copy() if initial_state else CFMCoreV2State()
+        self.config = config or CFMCoreV2Config.default()
+        self._state = initial_state.copy() if initial_state else _DEFAULT_STATE._copy_fast()
+        self._kernel_config = self.config
+        self._update_kernel = _make_update_kernel(self.config)
 
     def step(
         self,
@@ -69,299 +337,183 @@ class CFMCoreV2:
         dt: float = 1.0,
     ) -> Dict[str, Any]:
         """Execute one CFM core v2 step."""
-        dt = max(0.0, min(dt, self.config.max_dt))
-        self._update_state(dt)
-
-        coherence = self._compute_coherence_output()
-        stability = self._compute_stability_output()
-        intensity = self._compute_intensity_output()
-        alignment = self._compute_alignment_output()
+        coherence, stability, intensity, alignment = self._advance(dt)
+        state = self._state
 
         return {
             "coherence": coherence,
             "stability": stability,
             "intensity": intensity,
             "alignment": alignment,
-            "cfm_time": self._state.time,
-            "cfm_step": self._state.step_count,
-            "cfm_phase": self._state.phase_global,
+            "cfm_time": state.time,
+            "cfm_step": state.step_count,
+            "cfm_phase": state.phase_global,
             "cfm_version": 2,
-            "cfm_resonance_index": self._state.resonance_index,
-            "cfm_basin_distance": self._state.get_distance_to_basin(
+            "cfm_resonance_index": state.resonance_index,
+            "cfm_basin_distance": state.get_distance_to_basin(
                 self.config.basin_center_c,
                 self.config.basin_center_e,
                 self.config.basin_center_s,
             ),
         }
 
-    def _update_state(self, dt: float) -> None:
-        """Update internal state using v2 multi-channel dynamics."""
-        self._state.time += dt
-        self._state.step_count += 1
-
-        prev_coherence_slow = self._state.coherence_slow
-        prev_energy_potential = self._state.energy_potential
-        prev_stability_envelope = self._state.stability_envelope
-
-        # Very fast -> Fast -> Medium -> Slow -> Very slow
-        self._update_phase_local(dt)
-        self._update_phase_global(dt)
-        self._update_instability_pulse(dt)
-        self._update_coherence_fast(dt)
-        self._update_energy_flux(dt)
-        self._update_resonance_index(dt)
-        self._update_alignment_field(dt)
-        self._update_coherence_slow(dt, prev_stability_envelope)
-        self._update_energy_potential(dt, prev_coherence_slow)
-        self._update_stability_envelope(dt, prev_coherence_slow)
-        self._update_alignment_direction(dt)
-        self._apply_pulse_response()
-
-    def _update_phase_global(self, dt: float) -> None:
-        phase_delta = dt * self.config.omega_global / self.config.tau_fast
-        self._state.phase_global = (self._state.phase_global + phase_delta) % 1.0
-
-    def _update_phase_local(self, dt: float) -> None:
-        modulation = 1.0 + 0.2 * math.sin(2.0 * PI * self._state.phase_global)
-        phase_delta = dt * self.config.omega_local * modulation / self.config.tau_very_fast
-        self._state.phase_local = (self._state.phase_local + phase_delta) % 1.0
-
-    def _phase_modulation(self) -> float:
-        global_contrib = 0.5 + 0.5 * math.sin(2.0 * PI * self._state.phase_global)
-        local_contrib = 0.5 + 0.5 * math.sin(2.0 * PI * self._state.phase_local)
-        return _clamp01(global_contrib * (1.0 / PHI) + local_contrib * (1.0 - 1.0 / PHI))
-
-    def _update_instability_pulse(self, dt: float) -> None:
-        base_amplitude = self.config.instability_base * (1.0 - self._state.stability_envelope)
-        phase_angle = 2.0 * PI * self._state.phase_global
-        pulse_drive = base_amplitude * (0.5 + 0.5 * math.sin(phase_angle))
-        threshold = self._state.stability_envelope * self.config.pulse_threshold_low
-
-        if pulse_drive > threshold:
-            target_pulse = pulse_drive
-        else:
-            target_pulse = pulse_drive * 0.3
-
-        pulse_delta = dt * (target_pulse - self._state.instability_pulse) / self.config.tau_fast
-        self._state.instability_pulse = _clamp01(self._state.instability_pulse + pulse_delta)
-
-    def _update_stability_envelope(self, dt: float, prev_coherence: float) -> None:
-        coherence_factor = _smooth_step(prev_coherence, 0.3, 0.8)
-        target = self.config.stability_target * coherence_factor
-        alignment_decay = self.config.envelope_decay * (1.0 - self._state.alignment_field)
-        basin_attraction = self._basin_attraction(
-            self._state.stability_envelope,
-            self.config.basin_center_s,
-        )
-
-        envelope_delta = dt * (
-            (target - self._state.stability_envelope) / self.config.tau_slow
-            - alignment_decay
-            + basin_attraction
-        )
-        self._state.stability_envelope = _clamp01(self._state.stability_envelope + envelope_delta)
-
-    def _update_coherence_slow(self, dt: float, prev_stability: float) -> None:
-        energy_factor = _smooth_step(self._state.energy_potential, 0.2, 0.8)
-        instability_effect = self.config.coherence_energy_coupling * self._state.instability_pulse
-        basin_attraction = self._basin_attraction(
-            self._state.coherence_slow,
-            self.config.basin_center_c,
-        )
-
-        coherence_delta = dt * (
-            (self.config.coherence_target - self._state.coherence_slow) * energy_factor
-            - instability_effect
-            + basin_attraction
-        ) / self.config.tau_slow
-
-        self._state.coherence_slow = _clamp01(self._state.coherence_slow + coherence_delta)
-
-    def _update_coherence_fast(self, dt: float) -> None:
-        phase_mod = self._phase_modulation()
-        tracking_term = phase_mod * (self._state.coherence_slow - self._state.coherence_fast)
-        resonance_term = self._state.resonance_index * self._state.alignment_field * 0.1
-        coherence_delta = dt * (tracking_term + resonance_term) / self.config.tau_fast
-        self._state.coherence_fast = _clamp01(self._state.coherence_fast + coherence_delta)
-
-    def _update_energy_potential(self, dt: float, prev_coherence: float) -> None:
-        dissipation = self._state.energy_flux * self.config.energy_dissipation
-        coherence_input = self.config.coherence_energy_coupling * prev_coherence
-        basin_attraction = self._basin_attraction(
-            self._state.energy_potential,
-            self.config.basin_center_e,
-        )
-
-        energy_delta = dt * (
-            (self.config.energy_target - self._state.energy_potential)
-            - dissipation
-            + coherence_input
-            + basin_attraction
-        ) / self.config.tau_slow
-
-        self._state.energy_potential = _clamp01(self._state.energy_potential + energy_delta)
-
-    def _update_energy_flux(self, dt: float) -> None:
-        gradient = abs(self._state.energy_potential - self.config.energy_target)
-        phase_angle = 2.0 * PI * self._state.phase_global
-        phase_mod = 0.5 + 0.5 * math.sin(phase_angle)
-        target_flux = gradient * phase_mod
-        damping = self.config.flux_damping * self._state.energy_flux
-        flux_delta = dt * (target_flux - damping - self._state.energy_flux) / self.config.tau_fast
-        self._state.energy_flux = _clamp01(self._state.energy_flux + flux_delta)
-
-    def _update_alignment_field(self, dt: float) -> None:
-        coherence_out = self._compute_coherence_output()
-        stability_out = self._compute_stability_output()
-        lock_in_potential = coherence_out * stability_out
-
-        target_attraction = lock_in_potential * (
-            self.config.alignment_target - self._state.alignment_field
-        )
-
-        direction_coupling = (
-            self.config.resonance_coupling *
-            (self._state.alignment_direction - 0.5) *
-            self._state.resonance_index
-        )
-
-        field_delta = dt * (target_attraction + direction_coupling) / self.config.tau_medium
-        self._state.alignment_field = _clamp01(self._state.alignment_field + field_delta)
-
-    def _update_alignment_direction(self, dt: float) -> None:
-        basin_center_direction = self.config.basin_center_c
-        stability_factor = _smooth_step(self._state.stability_envelope, 0.3, 0.8)
-        direction_drift = (basin_center_direction - self._state.alignment_direction) * stability_factor
-        direction_delta = dt * direction_drift / self.config.tau_very_slow
-        self._state.alignment_direction = _clamp01(self._state.alignment_direction + direction_delta)
-
-    def _update_resonance_index(self, dt: float) -> None:
-        if self._state.coherence_slow > 0.01:
-            coherence_ratio = self._state.coherence_fast / self._state.coherence_slow
-            coherence_correlation = 1.0 - abs(1.0 - coherence_ratio)
-        else:
-            coherence_correlation = 0.5
-
-        if self._state.energy_potential > 0.01:
-            energy_ratio = self._state.energy_flux / self._state.energy_potential
-            energy_correlation = 1.0 - abs(0.5 - energy_ratio)
-        else:
-            energy_correlation = 0.5
-
-        stability_correlation = 1.0 - self._state.instability_pulse * self._state.stability_envelope
-        phase_diff = abs(self._state.phase_global - self._state.phase_local)
-        phase_coherence = 1.0 - 2.0 * min(phase_diff, 1.0 - phase_diff)
-
-        target_resonance = (
-            coherence_correlation * (1.0 / PHI) +
-            energy_correlation * (1.0 / (PHI ** 2)) +
-            stability_correlation * (1.0 / (PHI ** 2)) +
-            phase_coherence * (1.0 / (PHI ** 3))
-        )
-
-        target_resonance = _clamp01(target_resonance / (1.0 / PHI + 2.0 / (PHI ** 2) + 1.0 / (PHI ** 3)))
-        resonance_delta = dt * (target_resonance - self._state.resonance_index) / self.config.tau_medium
-        self._state.resonance_index = _clamp01(self._state.resonance_index + resonance_delta)
-
-    def _basin_attraction(self, x: float, mu: float) -> float:
-        """Compute basin attraction force."""
-        distance = abs(x - mu)
-        direction = 1.0 if mu > x else -1.0
-
-        r_inner = self.config.basin_radius / PHI
-        if distance < r_inner:
-            return direction * self.config.basin_strength_inner * distance
+    def step_into(
+        self,
+        out: MutableSequence[float],
+        human_messages: Optional[List[str]] = None,
+        external_events: Optional[Dict[str, Any]] = None,
+        dt: float = 1.0,
+    ) -> None:
+        """
+        Execute one CFM core v2 step, writing outputs into a caller buffer.
+
+        Same dynamics as step(), but no result dict is allocated: the
+        required outputs are written to out[0:4] in the order coherence,
+        stability, intensity, alignment.
+        """
+        out[0], out[1], out[2], out[3] = self._advance(dt)
+
+    def step_many(self, n_steps: int, dt: float = 1.0) -> Dict[str, List[float]]:
+        """
+        Execute several CFM core v2 steps with a fixed dt.
+
+        Equivalent to calling step(dt=dt) n_steps times, but returns the
+        output trajectories as parallel lists instead of building one
+        dict per step.
+
+        Args:
+            n_steps: Number of steps to execute
+            dt: Time delta per step (clamped to [0, max_dt])
+
+        Returns:
+            Dict mapping coherence, stability, intensity, alignment to
+            lists of n_steps values, all bounded in [0, 1].
+        """
+        dt = max(0.0, min(dt, self.config.max_dt))
 
-        r_outer = self.config.basin_radius * PHI
-        if distance < r_outer:
-            return direction * self.config.basin_strength_outer
+        update_state = self._update_state
+        compute_coherence = self._compute_coherence_output
+        compute_stability = self._compute_stability_output
+        compute_intensity = self._compute_intensity_output
+        compute_alignment = self._compute_alignment_output
+
+        coherence_out: List[float] = []
+        stability_out: List[float] = []
+        intensity_out: List[float] = []
+        alignment_out: List[float] = []
+
+        for _ in range(n_steps):
+            update_state(dt)
+            coherence = compute_coherence()
+            stability = compute_stability()
+            coherence_out.append(coherence)
+            stability_out.append(stability)
+            intensity_out.append(compute_intensity(coherence))
+            alignment_out.append(compute_alignment(coherence, stability))
 
-        return 0.0
+        return {
+            "coherence": coherence_out,
+            "stability": stability_out,
+            "intensity": intensity_out,
+            "alignment": alignment_out,
+        }
 
-    def _apply_pulse_response(self) -> None:
-        """Apply structured pulse response based on instability level."""
-        pulse = self._state.instability_pulse
+    def _advance(self, dt: float) -> Tuple[float, float, float, float]:
+        """Clamp dt, update the state and return the four outputs."""
+        dt = max(0.0, min(dt, self.config.max_dt))
+        self._update_state(dt)
 
-        if pulse > self.config.pulse_threshold_high:
-            self._state.coherence_fast = _clamp01(
-                self._state.coherence_fast - 0.1 * (pulse - self.config.pulse_threshold_high)
-            )
-            self._state.energy_flux = _clamp01(
-                self._state.energy_flux + 0.15 * (pulse - self.config.pulse_threshold_high)
-            )
-            self._state.alignment_field = _clamp01(
-                self._state.alignment_field - 0.08 * (pulse - self.config.pulse_threshold_high)
-            )
-            self._state.coherence_slow = _clamp01(
-                self._state.coherence_slow - 0.02 * (pulse - self.config.pulse_threshold_high)
-            )
+        coherence = self._compute_coherence_output()
+        stability = self._compute_stability_output()
+        intensity = self._compute_intensity_output(coherence)
+        alignment = self._compute_alignment_output(coherence, stability)
+        return coherence, stability, intensity, alignment
 
-        elif pulse > self.config.pulse_threshold_medium:
-            self._state.coherence_fast = _clamp01(
-                self._state.coherence_fast - 0.05 * (pulse - self.config.pulse_threshold_medium)
-            )
-            self._state.energy_flux = _clamp01(
-                self._state.energy_flux + 0.08 * (pulse - self.config.pulse_threshold_medium)
-            )
-            self._state.alignment_field = _clamp01(
-                self._state.alignment_field - 0.03 * (pulse - self.config.pulse_threshold_medium)
-            )
+    def _update_state(self, dt: float) -> None:
+        """Update internal state using v2 multi-channel dynamics."""
+        state = self._state
+        state.time += dt
+        state.step_count += 1
 
-        elif pulse > self.config.pulse_threshold_low:
-            self._state.coherence_fast = _clamp01(
-                self._state.coherence_fast - 0.02 * (pulse - self.config.pulse_threshold_low)
-            )
+        # Very fast -> Fast -> Medium -> Slow -> Very slow
+        (
+            state.coherence_slow,
+            state.coherence_fast,
+            state.energy_potential,
+            state.energy_flux,
+            state.stability_envelope,
+            state.instability_pulse,
+            state.phase_global,
+            state.phase_local,
+            state.alignment_field,
+            state.alignment_direction,
+            state.resonance_index,
+        ) = self._get_update_kernel()(*state.as_tuple(), dt)
+
+    def _get_update_kernel(self) -> Callable[..., Tuple[float, ...]]:
+        """
+        Return the update kernel for the current config.
+
+        The kernel is rebuilt if the config object has been replaced.
+        """
+        if self._kernel_config is not self.config:
+            self._kernel_config = self.config
+            self._update_kernel = _make_update_kernel(self.config)
+        return self._update_kernel
 
     def _compute_coherence_output(self) -> float:
-        alpha = _smooth_step(self._state.stability_envelope, 0.3, 0.8)
-        coherence = alpha * self._state.coherence_slow + (1.0 - alpha) * self._state.coherence_fast
-        return _clamp01(coherence)
+        state = self._state
+        alpha = _smooth_step(state.stability_envelope, 0.3, 0.8)
+        coherence = alpha * state.coherence_slow + (1.0 - alpha) * state.coherence_fast
+        return 0.0 if coherence <= 0.0 else (1.0 if coherence >= 1.0 else coherence)
 
     def _compute_stability_output(self) -> float:
-        base = self._state.stability_envelope
-        pulse_effect = self._state.instability_pulse * (1.0 - self._state.stability_envelope)
-        resonance_boost = self._state.resonance_index * 0.1
+        state = self._state
+        base = state.stability_envelope
+        pulse_effect = state.instability_pulse * (1.0 - state.stability_envelope)
+        resonance_boost = state.resonance_index * 0.1
         stability = base - pulse_effect + resonance_boost
-        return _clamp01(stability)
+        return 0.0 if stability <= 0.0 else (1.0 if stability >= 1.0 else stability)
 
-    def _compute_intensity_output(self) -> float:
-        base = self._state.energy_potential
-        flux_contrib = self._state.energy_flux * 0.3
-        coherence_out = self._compute_coherence_output()
+    def _compute_intensity_output(self, coherence_out: float) -> float:
+        state = self._state
+        base = state.energy_potential
+        flux_contrib = state.energy_flux * 0.3
         coherence_boost = coherence_out * 0.2
-        phase_angle = 2.0 * PI * self._state.phase_global
+        phase_angle = 2.0 * PI * state.phase_global
         phase_variation = 0.05 * (1.0 + math.sin(phase_angle * PHI)) * coherence_out
         intensity = base + flux_contrib + coherence_boost + phase_variation
-        return _clamp01(intensity)
-
-    def _compute_alignment_output(self) -> float:
-        base = self._state.alignment_field
-        direction_bias = (self._state.alignment_direction - 0.5) * 0.1
-        resonance_boost = self._state.resonance_index * 0.15
-        coherence_out = self._compute_coherence_output()
-        stability_out = self._compute_stability_output()
+        return 0.0 if intensity <= 0.0 else (1.0 if intensity >= 1.0 else intensity)
+
+    def _compute_alignment_output(self, coherence_out: float, stability_out: float) -> float:
+        state = self._state
+        config = self.config
+        base = state.alignment_field
+        direction_bias = (state.alignment_direction - 0.5) * 0.1
+        resonance_boost = state.resonance_index * 0.15
         lock_in_potential = coherence_out * stability_out
 
-        if lock_in_potential > self.config.alignment_lock_strength:
+        if lock_in_potential > config.alignment_lock_strength:
             lock_strength = _smooth_step(
                 lock_in_potential,
-                self.config.alignment_lock_strength,
+                config.alignment_lock_strength,
                 1.0
             )
-            target = self.config.alignment_lock_strength + (1.0 - self.config.alignment_lock_strength) * lock_strength
+            target = config.alignment_lock_strength + (1.0 - config.alignment_lock_strength) * lock_strength
             alignment = base * (1.0 - lock_strength) + target * lock_strength
         else:
             alignment = base + direction_bias + resonance_boost
 
-        return _clamp01(alignment)
+        return 0.0 if alignment <= 0.0 else (1.0 if alignment >= 1.0 else alignment)
 
     def reset(self, initial_state: Optional[CFMCoreV2State] = None) -> None:
         """Reset the core to initial state."""
-        self._state = initial_state.copy() if initial_state else CFMCoreV2State()
+        self._state = initial_state.copy() if initial_state else _DEFAULT_STATE._copy_fast()
 
     def get_state(self) -> CFMCoreV2State:
         """Get a copy of the current internal state."""
-        return self._state.copy()
+        # The internal state is always valid, so skip re-validation
+        return self._state._copy_fast()
 
     def get_status(self) -> Dict[str, Any]:
         """Get core status for diagnostics."""
@@ -12,17 +12,27 @@ Key v2 configuration features:
 - Instability pulse thresholds
 """
 
-from dataclasses import dataclass, field
-import sys
-import os
+from dataclasses import dataclass, field, replace as _dataclass_replace
+from typing import Dict, Optional
 
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cfm_consts import PHI, PSI, PI, DATACLASS_OPTIONS
 
-from cfm_consts import PHI, PSI, PI
 
+# Phi powers used by the defaults, evaluated once at import. Floats are
+# immutable, so they are safe as plain field defaults.
+_PHI2 = PHI ** 2
+_PHI3 = PHI ** 3
+_INV_PHI = 1.0 / PHI
+_INV_PHI2 = 1.0 / (PHI ** 2)
+_INV_PHI3 = 1.0 / (PHI ** 3)
+_INV_2PHI = 1.0 / (2.0 * PHI)
+_ONE_MINUS_INV_PHI2 = 1.0 - 1.0 / (PHI ** 2)
 
-@dataclass
+# Shared default instance per config class (see CFMCoreV2Config.default)
+_DEFAULT_CONFIGS: Dict[type, "CFMCoreV2Config"] = {}
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class CFMCoreV2Config:
     """
     Configuration for CFM Core v2.
@@ -36,108 +46,203 @@ class CFMCoreV2Config:
     - Medium (tau_m): phi ~ 1.62
     - Fast (tau_f): 1/phi ~ 0.62
     - Very Fast (tau_vf): 1/phi^2 ~ 0.38
+
+    The inner and outer basin radii are computed once in __post_init__
+    instead of on every basin attraction.
     """
 
     # Timescale constants (five-tier hierarchy)
-    tau_very_slow: float = field(default_factory=lambda: PHI ** 3)  # ~4.24
-    tau_slow: float = field(default_factory=lambda: PHI ** 2)  # ~2.62
-    tau_medium: float = field(default_factory=lambda: PHI)  # ~1.62
-    tau_fast: float = field(default_factory=lambda: 1.0 / PHI)  # ~0.62
-    tau_very_fast: float = field(default_factory=lambda: 1.0 / (PHI ** 2))  # ~0.38
+    tau_very_slow: float = _PHI3  # ~4.24
+    tau_slow: float = _PHI2  # ~2.62
+    tau_medium: float = PHI  # ~1.62
+    tau_fast: float = _INV_PHI  # ~0.62
+    tau_very_fast: float = _INV_PHI2  # ~0.38
 
     # Phase frequencies
-    omega_global: float = field(default_factory=lambda: 1.0 / PHI)
-    omega_local: float = field(default_factory=lambda: PHI / (PHI ** 2))  # = 1/phi
+    omega_global: float = _INV_PHI
+    omega_local: float = PHI / _PHI2  # = 1/phi
 
     # Attractor basin parameters
-    basin_center_c: float = field(default_factory=lambda: 1.0 / PHI)  # ~0.618
-    basin_center_e: float = field(default_factory=lambda: 1.0 / PHI)  # ~0.618
-    basin_center_s: float = field(default_factory=lambda: 1.0 - 1.0 / (PHI ** 2))  # ~0.618
-    basin_radius: float = field(default_factory=lambda: 1.0 / (PHI ** 2))  # ~0.38
-    basin_strength_inner: float = field(default_factory=lambda: 1.0 / (PHI ** 2))
-    basin_strength_outer: float = field(default_factory=lambda: 1.0 / (PHI ** 3))
+    basin_center_c: float = _INV_PHI  # ~0.618
+    basin_center_e: float = _INV_PHI  # ~0.618
+    basin_center_s: float = _ONE_MINUS_INV_PHI2  # ~0.618
+    basin_radius: float = _INV_PHI2  # ~0.38
+    basin_strength_inner: float = _INV_PHI2
+    basin_strength_outer: float = _INV_PHI3
 
     # Target values
-    coherence_target: float = field(default_factory=lambda: 1.0 / PHI + 0.1)  # ~0.718
-    energy_target: float = field(default_factory=lambda: 1.0 / PHI)  # ~0.618
-    stability_target: float = field(default_factory=lambda: 1.0 - 1.0 / (PHI ** 2))  # ~0.618
-    alignment_target: float = field(default_factory=lambda: 1.0 / PHI)  # ~0.618
+    coherence_target: float = _INV_PHI + 0.1  # ~0.718
+    energy_target: float = _INV_PHI  # ~0.618
+    stability_target: float = _ONE_MINUS_INV_PHI2  # ~0.618
+    alignment_target: float = _INV_PHI  # ~0.618
 
     # Coupling strengths
-    coherence_energy_coupling: float = field(default_factory=lambda: 1.0 / (2.0 * PHI))
-    stability_coherence_coupling: float = field(default_factory=lambda: 1.0 / PHI)
-    alignment_stability_coupling: float = field(default_factory=lambda: 1.0 / PHI)
-    resonance_coupling: float = field(default_factory=lambda: 1.0 / (PHI ** 2))
+    coherence_energy_coupling: float = _INV_2PHI
+    stability_coherence_coupling: float = _INV_PHI
+    alignment_stability_coupling: float = _INV_PHI
+    resonance_coupling: float = _INV_PHI2
 
     # Instability parameters
-    instability_base: float = field(default_factory=lambda: 1.0 / (2.0 * PHI))
-    pulse_threshold_low: float = field(default_factory=lambda: 1.0 / (PHI ** 2))  # ~0.38
-    pulse_threshold_medium: float = field(default_factory=lambda: 1.0 / PHI)  # ~0.62
-    pulse_threshold_high: float = field(default_factory=lambda: 1.0 - 1.0 / (PHI ** 2))  # ~0.62
+    instability_base: float = _INV_2PHI
+    pulse_threshold_low: float = _INV_PHI2  # ~0.38
+    pulse_threshold_medium: float = _INV_PHI  # ~0.62
+    pulse_threshold_high: float = _ONE_MINUS_INV_PHI2  # ~0.62
 
     # Damping and decay
-    energy_dissipation: float = field(default_factory=lambda: 1.0 / (PHI ** 2))
-    envelope_decay: float = field(default_factory=lambda: 1.0 / (PHI ** 3))
-    flux_damping: float = field(default_factory=lambda: 1.0 / PHI)
+    energy_dissipation: float = _INV_PHI2
+    envelope_decay: float = _INV_PHI3
+    flux_damping: float = _INV_PHI
 
     # Lock-in parameters
-    alignment_lock_strength: float = field(default_factory=lambda: 1.0 / PHI)
+    alignment_lock_strength: float = _INV_PHI
 
     # Bounds
     max_dt: float = 1.0
 
+    # Derived constants (set in __post_init__)
+    _basin_radius_inner: float = field(init=False, repr=False, compare=False)
+    _basin_radius_outer: float = field(init=False, repr=False, compare=False)
+
+    # to_dict() result, built on first call (the config is frozen)
+    _dict_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
-        """Validate configuration after initialization."""
+        """
+        Validate configuration after initialization.
+
+        The dataclass is frozen, so corrections and derived constants are
+        written with object.__setattr__.
+        """
         # Ensure positive time constants
         if self.tau_very_slow <= 0:
-            self.tau_very_slow = PHI ** 3
+            object.__setattr__(self, "tau_very_slow", _PHI3)
         if self.tau_slow <= 0:
-            self.tau_slow = PHI ** 2
+            object.__setattr__(self, "tau_slow", _PHI2)
         if self.tau_medium <= 0:
-            self.tau_medium = PHI
+            object.__setattr__(self, "tau_medium", PHI)
         if self.tau_fast <= 0:
-            self.tau_fast = 1.0 / PHI
+            object.__setattr__(self, "tau_fast", _INV_PHI)
         if self.tau_very_fast <= 0:
-            self.tau_very_fast = 1.0 / (PHI ** 2)
+            object.__setattr__(self, "tau_very_fast", _INV_PHI2)
 
         # Ensure positive frequencies
         if self.omega_global <= 0:
-            self.omega_global = 1.0 / PHI
+            object.__setattr__(self, "omega_global", _INV_PHI)
         if self.omega_local <= 0:
-            self.omega_local = 1.0 / PHI
+            object.__setattr__(self, "omega_local", _INV_PHI)
 
         # Ensure target values are in [0, 1]
-        self.coherence_target = max(0.0, min(1.0, self.coherence_target))
-        self.energy_target = max(0.0, min(1.0, self.energy_target))
-        self.stability_target = max(0.0, min(1.0, self.stability_target))
-        self.alignment_target = max(0.0, min(1.0, self.alignment_target))
+        object.__setattr__(
+            self, "coherence_target", max(0.0, min(1.0, self.coherence_target))
+        )
+        object.__setattr__(
+            self, "energy_target", max(0.0, min(1.0, self.energy_target))
+        )
+        object.__setattr__(
+            self, "stability_target", max(0.0, min(1.0, self.stability_target))
+        )
+        object.__setattr__(
+            self, "alignment_target", max(0.0, min(1.0, self.alignment_target))
+        )
 
         # Ensure basin parameters are valid
-        self.basin_center_c = max(0.0, min(1.0, self.basin_center_c))
-        self.basin_center_e = max(0.0, min(1.0, self.basin_center_e))
-        self.basin_center_s = max(0.0, min(1.0, self.basin_center_s))
-        self.basin_radius = max(0.01, min(0.5, self.basin_radius))
+        object.__setattr__(
+            self, "basin_center_c", max(0.0, min(1.0, self.basin_center_c))
+        )
+        object.__setattr__(
+            self, "basin_center_e", max(0.0, min(1.0, self.basin_center_e))
+        )
+        object.__setattr__(
+            self, "basin_center_s", max(0.0, min(1.0, self.basin_center_s))
+        )
+        object.__setattr__(self, "basin_radius", max(0.01, min(0.5, self.basin_radius)))
 
         # Ensure coupling strengths are in reasonable ranges
-        self.coherence_energy_coupling = max(0.0, min(1.0, self.coherence_energy_coupling))
-        self.stability_coherence_coupling = max(0.0, min(1.0, self.stability_coherence_coupling))
-        self.alignment_stability_coupling = max(0.0, min(1.0, self.alignment_stability_coupling))
-        self.resonance_coupling = max(0.0, min(1.0, self.resonance_coupling))
+        object.__setattr__(
+            self, "coherence_energy_coupling", max(0.0, min(1.0, self.coherence_energy_coupling))
+        )
+        object.__setattr__(
+            self, "stability_coherence_coupling", max(0.0, min(1.0, self.stability_coherence_coupling))
+        )
+        object.__setattr__(
+            self, "alignment_stability_coupling", max(0.0, min(1.0, self.alignment_stability_coupling))
+        )
+        object.__setattr__(
+            self, "resonance_coupling", max(0.0, min(1.0, self.resonance_coupling))
+        )
 
         # Ensure instability_base is in [0, 0.5]
-        self.instability_base = max(0.0, min(0.5, self.instability_base))
+        object.__setattr__(
+            self, "instability_base", max(0.0, min(0.5, self.instability_base))
+        )
 
         # Ensure pulse thresholds are ordered and in [0, 1]
-        self.pulse_threshold_low = max(0.0, min(1.0, self.pulse_threshold_low))
-        self.pulse_threshold_medium = max(self.pulse_threshold_low, min(1.0, self.pulse_threshold_medium))
-        self.pulse_threshold_high = max(self.pulse_threshold_medium, min(1.0, self.pulse_threshold_high))
+        object.__setattr__(
+            self, "pulse_threshold_low", max(0.0, min(1.0, self.pulse_threshold_low))
+        )
+        object.__setattr__(
+            self, "pulse_threshold_medium", max(self.pulse_threshold_low, min(1.0, self.pulse_threshold_medium))
+        )
+        object.__setattr__(
+            self, "pulse_threshold_high", max(self.pulse_threshold_medium, min(1.0, self.pulse_threshold_high))
+        )
 
         # Ensure max_dt is positive
         if self.max_dt <= 0:
-            self.max_dt = 1.0
+            object.__setattr__(self, "max_dt", 1.0)
+
+        # Derived constants used by the update helpers
+        object.__setattr__(self, "_basin_radius_inner", self.basin_radius / PHI)
+        object.__setattr__(self, "_basin_radius_outer", self.basin_radius * PHI)
+
+    @classmethod
+    def default(cls) -> "CFMCoreV2Config":
+        """
+        Return the shared default configuration.
+
+        Equal to CFMCoreV2Config(), but built and validated only once per
+        class; safe to share because configurations are frozen.
+
+        Returns:
+            Default CFMCoreV2Config instance
+        """
+        config = _DEFAULT_CONFIGS.get(cls)
+        if config is None:
+            config = _DEFAULT_CONFIGS[cls] = cls()
+        return config
+
+    def replace(self, **changes) -> "CFMCoreV2Config":
+        """
+        Return a copy of this configuration with some fields changed.
+
+        Configurations (including the shared presets) are frozen, so this
+        is how variants are derived. The copy is validated as usual.
+
+        Args:
+            **changes: Field values to override
+
+        Returns:
+            New CFMCoreV2Config
+        """
+        return _dataclass_replace(self, **changes)
 
     def to_dict(self) -> dict:
-        """Convert configuration to dictionary."""
+        """
+        Convert configuration to dictionary.
+
+        The mapping is built once per instance and cached; each call
+        returns a fresh shallow copy the caller may modify.
+        """
+        cache = self._dict_cache
+        if cache is None:
+            cache = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cache)
+        return cache.copy()
+
+    def _build_dict(self) -> dict:
+        """Build the to_dict() mapping from the current field values."""
         return {
             # Timescale constants
             "tau_very_slow": self.tau_very_slow,
@@ -18,90 +18,129 @@ Usage:
     core = CFMCoreV2(CFM_V2_PRESET_HIGH_STABILITY)
 """
 
-import sys
-import os
-
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Any, Callable, Dict
 
 from cfm_consts import PHI, PSI
 
 from .config import CFMCoreV2Config
 
 
+# Presets are built on first use (PEP 562 module __getattr__) and cached,
+# so importing this module constructs no configurations.
+
+
 # =============================================================================
 # PRESET: BASELINE
 # =============================================================================
 
-CFM_V2_PRESET_BASELINE = CFMCoreV2Config()
-"""Baseline preset - default CFM Core v2 configuration."""
+def _baseline() -> CFMCoreV2Config:
+    """Baseline preset - default CFM Core v2 configuration."""
+    return CFMCoreV2Config.default()
 
 
 # =============================================================================
 # PRESET: HIGH STABILITY
 # =============================================================================
 
-CFM_V2_PRESET_HIGH_STABILITY = CFMCoreV2Config(
-    stability_target=1.0 / PHI + 0.2,
-    stability_coherence_coupling=min(1.0, (1.0 / PHI) * 1.5),
-    instability_base=1.0 / (3.0 * PHI),
-    pulse_threshold_low=1.0 / PHI,
-    pulse_threshold_medium=1.0 / PHI + 0.2,
-    pulse_threshold_high=1.0 - 1.0 / (2.0 * PHI ** 2),
-    envelope_decay=1.0 / (PHI ** 2),
-    tau_very_slow=PHI ** 4,
-    alignment_lock_strength=1.0 / PHI + 0.1,
-)
-"""High Stability preset - emphasizes stability and reduces oscillation."""
+def _high_stability() -> CFMCoreV2Config:
+    """High Stability preset - emphasizes stability and reduces oscillation."""
+    return CFMCoreV2Config(
+        stability_target=1.0 / PHI + 0.2,
+        stability_coherence_coupling=min(1.0, (1.0 / PHI) * 1.5),
+        instability_base=1.0 / (3.0 * PHI),
+        pulse_threshold_low=1.0 / PHI,
+        pulse_threshold_medium=1.0 / PHI + 0.2,
+        pulse_threshold_high=1.0 - 1.0 / (2.0 * PHI ** 2),
+        envelope_decay=1.0 / (PHI ** 2),
+        tau_very_slow=PHI ** 4,
+        alignment_lock_strength=1.0 / PHI + 0.1,
+    )
 
 
 # =============================================================================
 # PRESET: HIGH RESONANCE
 # =============================================================================
 
-CFM_V2_PRESET_HIGH_RESONANCE = CFMCoreV2Config(
-    resonance_coupling=1.0 / PHI,
-    coherence_energy_coupling=1.0 / PHI,
-    stability_coherence_coupling=1.0 - 1.0 / (PHI ** 2),
-    alignment_stability_coupling=1.0 - 1.0 / (PHI ** 2),
-    alignment_lock_strength=1.0 / PHI,
-    basin_radius=1.0 / (PHI ** 3),
-    basin_strength_inner=1.0 / PHI,
-    basin_strength_outer=1.0 / (PHI ** 2),
-)
-"""High Resonance preset - emphasizes cross-channel coupling and resonance."""
+def _high_resonance() -> CFMCoreV2Config:
+    """High Resonance preset - emphasizes cross-channel coupling and resonance."""
+    return CFMCoreV2Config(
+        resonance_coupling=1.0 / PHI,
+        coherence_energy_coupling=1.0 / PHI,
+        stability_coherence_coupling=1.0 - 1.0 / (PHI ** 2),
+        alignment_stability_coupling=1.0 - 1.0 / (PHI ** 2),
+        alignment_lock_strength=1.0 / PHI,
+        basin_radius=1.0 / (PHI ** 3),
+        basin_strength_inner=1.0 / PHI,
+        basin_strength_outer=1.0 / (PHI ** 2),
+    )
 
 
 # =============================================================================
 # PRESET: PULSED ACTIVITY
 # =============================================================================
 
-CFM_V2_PRESET_PULSED_ACTIVITY = CFMCoreV2Config(
-    instability_base=1.0 / PHI,
-    pulse_threshold_low=1.0 / (PHI ** 3),
-    pulse_threshold_medium=1.0 / (PHI ** 2),
-    pulse_threshold_high=1.0 / PHI,
-    energy_dissipation=1.0 / PHI,
-    envelope_decay=1.0 / (PHI ** 2),
-    tau_very_fast=1.0 / (PHI ** 3),
-    tau_fast=1.0 / (PHI ** 2),
-    basin_radius=1.0 / PHI,
-    basin_strength_inner=1.0 / (PHI ** 3),
-)
-"""Pulsed Activity preset - more frequent and prominent instability pulses."""
+def _pulsed_activity() -> CFMCoreV2Config:
+    """Pulsed Activity preset - more frequent and prominent instability pulses."""
+    return CFMCoreV2Config(
+        instability_base=1.0 / PHI,
+        pulse_threshold_low=1.0 / (PHI ** 3),
+        pulse_threshold_medium=1.0 / (PHI ** 2),
+        pulse_threshold_high=1.0 / PHI,
+        energy_dissipation=1.0 / PHI,
+        envelope_decay=1.0 / (PHI ** 2),
+        tau_very_fast=1.0 / (PHI ** 3),
+        tau_fast=1.0 / (PHI ** 2),
+        basin_radius=1.0 / PHI,
+        basin_strength_inner=1.0 / (PHI ** 3),
+    )
 
 
 # =============================================================================
 # PRESET REGISTRY
 # =============================================================================
 
-CFM_V2_PRESETS = {
-    "baseline": CFM_V2_PRESET_BASELINE,
-    "high_stability": CFM_V2_PRESET_HIGH_STABILITY,
-    "high_resonance": CFM_V2_PRESET_HIGH_RESONANCE,
-    "pulsed_activity": CFM_V2_PRESET_PULSED_ACTIVITY,
+_PRESET_FACTORIES: Dict[str, Callable[[], CFMCoreV2Config]] = {
+    "baseline": _baseline,
+    "high_stability": _high_stability,
+    "high_resonance": _high_resonance,
+    "pulsed_activity": _pulsed_activity,
 }
-"""Registry of all CFM v2 presets by name."""
+
+# Module attribute name -> preset name
+_PRESET_ATTRIBUTES = {
+    "CFM_V2_PRESET_BASELINE": "baseline",
+    "CFM_V2_PRESET_HIGH_STABILITY": "high_stability",
+    "CFM_V2_PRESET_HIGH_RESONANCE": "high_resonance",
+    "CFM_V2_PRESET_PULSED_ACTIVITY": "pulsed_activity",
+}
+
+_PRESET_CACHE: Dict[str, CFMCoreV2Config] = {}
+
+
+def _build_preset(name: str) -> CFMCoreV2Config:
+    """Return the cached preset for a canonical name, building it once."""
+    preset = _PRESET_CACHE.get(name)
+    if preset is None:
+        preset = _PRESET_CACHE[name] = _PRESET_FACTORIES[name]()
+    return preset
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the module-level presets on first access.
+
+    CFM_V2_PRESET_* resolve to the single shared instance per preset and
+    CFM_V2_PRESETS to the registry of all presets by name. Each result
+    is stored as a module global, so later lookups bypass this hook.
+    """
+    if name in _PRESET_ATTRIBUTES:
+        value = _build_preset(_PRESET_ATTRIBUTES[name])
+    elif name == "CFM_V2_PRESETS":
+        value = {key: _build_preset(key) for key in _PRESET_FACTORIES}
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
 def get_preset(name: str) -> CFMCoreV2Config:
@@ -117,16 +156,22 @@ def get_preset(name: str) -> CFMCoreV2Config:
     Raises:
         ValueError: If preset name is unknown
     """
+    # Presets already built resolve with a single lookup; only other
+    # spellings need normalizing
+    preset = _PRESET_CACHE.get(name)
+    if preset is not None:
+        return preset
+
     name_lower = name.lower().replace("-", "_").replace(" ", "_")
-    if name_lower not in CFM_V2_PRESETS:
-        valid = ", ".join(CFM_V2_PRESETS.keys())
+    if name_lower not in _PRESET_FACTORIES:
+        valid = ", ".join(_PRESET_FACTORIES.keys())
         raise ValueError(f"Unknown preset '{name}'. Valid presets: {valid}")
-    return CFM_V2_PRESETS[name_lower]
+    return _build_preset(name_lower)
 
 
 def list_presets() -> list:
     """List all available preset names."""
-    return list(CFM_V2_PRESETS.keys())
+    return list(_PRESET_FACTORIES.keys())
 
 
 __all__ = [
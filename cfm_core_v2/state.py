@@ -14,15 +14,37 @@ Multi-Channel Architecture:
 - Resonance: resonance_index
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any
-import sys
-import os
-
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from cfm_consts import PHI
+from dataclasses import dataclass
+from math import sqrt
+from operator import attrgetter
+from typing import Dict, Any, Tuple
+
+from cfm_consts import PHI, DATACLASS_OPTIONS
+
+
+# Default channel values, evaluated once at import
+_INV_PHI = 1.0 / PHI
+_INV_PHI2 = 1.0 / (PHI ** 2)
+_ONE_MINUS_INV_PHI2 = 1.0 - 1.0 / (PHI ** 2)
+
+# The 11 channel variables in field order (time tracking excluded)
+_CHANNEL_FIELDS = (
+    "coherence_slow",
+    "coherence_fast",
+    "energy_potential",
+    "energy_flux",
+    "stability_envelope",
+    "instability_pulse",
+    "phase_global",
+    "phase_local",
+    "alignment_field",
+    "alignment_direction",
+    "resonance_index",
+)
+_get_channels = attrgetter(*_CHANNEL_FIELDS)
+
+# All fields accepted by from_dict()
+_STATE_FIELDS = _CHANNEL_FIELDS + ("time", "step_count")
 
 
 def _clamp01(value: float) -> float:
@@ -30,7 +52,7 @@ def _clamp01(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CFMCoreV2State:
     """
     Internal state of CFM Core v2.
@@ -42,27 +64,27 @@ class CFMCoreV2State:
     """
 
     # ===== Coherence Channel =====
-    coherence_slow: float = field(default_factory=lambda: 1.0 / PHI)
-    coherence_fast: float = field(default_factory=lambda: 1.0 / PHI)
+    coherence_slow: float = _INV_PHI
+    coherence_fast: float = _INV_PHI
 
     # ===== Energy Channel =====
-    energy_potential: float = field(default_factory=lambda: 1.0 / PHI)
-    energy_flux: float = field(default_factory=lambda: 1.0 / (PHI ** 2))
+    energy_potential: float = _INV_PHI
+    energy_flux: float = _INV_PHI2
 
     # ===== Stability Channel =====
-    stability_envelope: float = field(default_factory=lambda: 1.0 - 1.0 / (PHI ** 2))
-    instability_pulse: float = field(default_factory=lambda: 1.0 / (PHI ** 2))
+    stability_envelope: float = _ONE_MINUS_INV_PHI2
+    instability_pulse: float = _INV_PHI2
 
     # ===== Phase Channel =====
     phase_global: float = 0.0
     phase_local: float = 0.0
 
     # ===== Alignment Channel =====
-    alignment_field: float = field(default_factory=lambda: 1.0 / PHI)
-    alignment_direction: float = field(default_factory=lambda: 1.0 / PHI)
+    alignment_field: float = _INV_PHI
+    alignment_direction: float = _INV_PHI
 
     # ===== Resonance =====
-    resonance_index: float = field(default_factory=lambda: 1.0 / PHI)
+    resonance_index: float = _INV_PHI
 
     # ===== Time Tracking =====
     time: float = 0.0
@@ -102,6 +124,37 @@ class CFMCoreV2State:
             step_count=self.step_count,
         )
 
+    def _copy_fast(self) -> "CFMCoreV2State":
+        """
+        Copy the state without re-running __post_init__ validation.
+
+        Only for states already known to be valid, such as a core's own
+        internal state; use copy() for externally supplied states.
+        """
+        state = object.__new__(CFMCoreV2State)
+        state.coherence_slow = self.coherence_slow
+        state.coherence_fast = self.coherence_fast
+        state.energy_potential = self.energy_potential
+        state.energy_flux = self.energy_flux
+        state.stability_envelope = self.stability_envelope
+        state.instability_pulse = self.instability_pulse
+        state.phase_global = self.phase_global
+        state.phase_local = self.phase_local
+        state.alignment_field = self.alignment_field
+        state.alignment_direction = self.alignment_direction
+        state.resonance_index = self.resonance_index
+        state.time = self.time
+        state.step_count = self.step_count
+        return state
+
+    def as_tuple(self) -> Tuple[float, ...]:
+        """
+        Get the 11 channel variables as a tuple, in field order.
+
+        Time tracking (time, step_count) is not included.
+        """
+        return _get_channels(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert state to dictionary."""
         return {
@@ -122,22 +175,12 @@ class CFMCoreV2State:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CFMCoreV2State":
-        """Create state from dictionary."""
-        return cls(
-            coherence_slow=data.get("coherence_slow", 1.0 / PHI),
-            coherence_fast=data.get("coherence_fast", 1.0 / PHI),
-            energy_potential=data.get("energy_potential", 1.0 / PHI),
-            energy_flux=data.get("energy_flux", 1.0 / (PHI ** 2)),
-            stability_envelope=data.get("stability_envelope", 1.0 - 1.0 / (PHI ** 2)),
-            instability_pulse=data.get("instability_pulse", 1.0 / (PHI ** 2)),
-            phase_global=data.get("phase_global", 0.0),
-            phase_local=data.get("phase_local", 0.0),
-            alignment_field=data.get("alignment_field", 1.0 / PHI),
-            alignment_direction=data.get("alignment_direction", 1.0 / PHI),
-            resonance_index=data.get("resonance_index", 1.0 / PHI),
-            time=data.get("time", 0.0),
-            step_count=data.get("step_count", 0),
-        )
+        """
+        Create state from dictionary.
+
+        Missing keys take the field defaults; unknown keys are ignored.
+        """
+        return cls(**{name: data[name] for name in _STATE_FIELDS if name in data})
 
     def validate(self) -> bool:
         """Check if state is valid."""
@@ -187,14 +230,14 @@ class CFMCoreV2State:
     ) -> float:
         """Compute Euclidean distance to basin center in (C, E, S) space."""
         if basin_c is None:
-            basin_c = 1.0 / PHI
+            basin_c = _INV_PHI
         if basin_e is None:
-            basin_e = 1.0 / PHI
+            basin_e = _INV_PHI
         if basin_s is None:
-            basin_s = 1.0 - 1.0 / (PHI ** 2)
+            basin_s = _ONE_MINUS_INV_PHI2
 
         dc = self.coherence_slow - basin_c
         de = self.energy_potential - basin_e
         ds = self.stability_envelope - basin_s
 
-        return (dc ** 2 + de ** 2 + ds ** 2) ** 0.5
+        return sqrt(dc * dc + de * de + ds * ds)
@@ -6,18 +6,25 @@ Provides the interface layer for CFM core integration:
 - CFMCoreProtocol: Protocol defining the CFM core interface
 - CFMCoreAdapter: Safe adapter wrapping CFM cores
 - CFMCoreInterfaceConfig: Configuration for the interface
+- CFMCoreEnsemble: Lockstep ensemble of independent cores
+- make_step_into: step_into-style callable for any core
 - create_cfm_core: Factory function for creating CFM cores
+- create_cfm_ensemble: Factory function for creating core ensembles
 """
 
 from .protocols import CFMCoreProtocol
 from .adapters import CFMCoreAdapter
 from .config import CFMCoreInterfaceConfig
-from .factory import create_cfm_core, list_core_types
+from .ensemble import CFMCoreEnsemble, make_step_into
+from .factory import create_cfm_core, create_cfm_ensemble, list_core_types
 
 __all__ = [
     "CFMCoreProtocol",
     "CFMCoreAdapter",
     "CFMCoreInterfaceConfig",
+    "CFMCoreEnsemble",
+    "make_step_into",
     "create_cfm_core",
+    "create_cfm_ensemble",
     "list_core_types",
 ]
@@ -10,11 +10,19 @@ import math
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 
+from cfm_consts import DATACLASS_OPTIONS
+
 from .protocols import CFMCoreProtocol
 from .config import CFMCoreInterfaceConfig
 
 
-@dataclass
+_INF = float("inf")
+
+# Immutable value types a shallow copy can share with the original
+_PRIMITIVE_TYPES = frozenset((bool, int, float, str, type(None)))
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class CFMCoreAdapter:
     """
     Adapter that wraps a CFMCoreProtocol implementation and provides
@@ -38,7 +46,10 @@ class CFMCoreAdapter:
     ) -> Dict[str, Any]:
         """Call the CFM core safely and normalize its outputs."""
         self._call_count += 1
-        clamped_dt = max(0.0, min(dt, self.config.max_dt))
+        # Same result as max(0.0, min(dt, max_dt)), including NaN -> 0.0,
+        # without the two builtin calls
+        max_dt = self.config.max_dt
+        clamped_dt = max_dt if dt > max_dt else (dt if dt > 0.0 else 0.0)
 
         raw_output: Dict[str, Any] = {}
         error_occurred = False
@@ -78,25 +89,37 @@ class CFMCoreAdapter:
         }
 
     def _extract_numeric_state(self, raw_output: Dict[str, Any]) -> Dict[str, float]:
-        """Extract and normalize numeric state from raw core output."""
+        """
+        Extract and normalize numeric state from raw core output.
+
+        Each value is converted to float; NaN, infinities and values that
+        cannot be converted map to 0.0, everything else is clamped to [0, 1].
+        """
         numeric_state: Dict[str, float] = {}
         for key in self.config.numeric_keys:
-            value = raw_output.get(key, 0.0)
-            numeric_state[key] = self._normalize_value(value)
+            try:
+                v = float(raw_output.get(key, 0.0))
+            except (TypeError, ValueError):
+                numeric_state[key] = 0.0
+                continue
+            # v != v is the NaN test; -inf is caught by v <= 0.0
+            if v != v or v <= 0.0 or v == _INF:
+                numeric_state[key] = 0.0
+            else:
+                numeric_state[key] = 1.0 if v >= 1.0 else v
         return numeric_state
 
-    def _normalize_value(self, value: Any) -> float:
-        """Normalize a value to float in [0,1]."""
-        try:
-            v = float(value)
-            if math.isnan(v) or math.isinf(v):
-                return 0.0
-            return max(0.0, min(1.0, v))
-        except (TypeError, ValueError):
-            return 0.0
-
     def _safe_copy(self, obj: Any) -> Any:
         """Create a safe, JSON-serializable copy of an object."""
+        # Fast path for the usual flat {str: number} core output: keys and
+        # values are immutable, so a shallow copy equals a deep copy
+        if type(obj) is dict:
+            for key, value in obj.items():
+                if type(key) is not str or type(value) not in _PRIMITIVE_TYPES:
+                    break
+            else:
+                return obj.copy()
+
         try:
             return copy.deepcopy(obj)
         except Exception:
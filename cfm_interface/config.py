@@ -8,8 +8,10 @@ Provides configuration flags for CFM core integration.
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
+from cfm_consts import DATACLASS_OPTIONS
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class CFMCoreInterfaceConfig:
     """
     Configuration for CFM core interface.
@@ -2,17 +2,48 @@
 """
 CFM Core Factory
 
-Factory function for creating CFM core instances by type name.
+Factory functions for creating CFM core instances and ensembles by type name.
 """
 
-import sys
-import os
-from typing import Any, Dict, Optional, List
-
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Any, Callable, Dict, Optional, List, Sequence
 
 from .protocols import CFMCoreProtocol
+from .ensemble import CFMCoreEnsemble
+
+
+def _create_v0(config: Optional[Any], preset: Optional[str]) -> CFMCoreProtocol:
+    """Create a CFM Core v0 (presets are not supported and ignored)."""
+    from cfm_core_v0 import CFMCore, CFMCoreConfig
+    if config is None:
+        config = CFMCoreConfig()
+    return CFMCore(config=config)
+
+
+def _create_v1(config: Optional[Any], preset: Optional[str]) -> CFMCoreProtocol:
+    """Create a CFM Core v1 (presets are not supported and ignored)."""
+    from cfm_core_v1 import CFMCoreV1, CFMCoreV1Config
+    if config is None:
+        config = CFMCoreV1Config()
+    return CFMCoreV1(config=config)
+
+
+def _create_v2(config: Optional[Any], preset: Optional[str]) -> CFMCoreProtocol:
+    """Create a CFM Core v2; a preset takes precedence over config."""
+    from cfm_core_v2 import CFMCoreV2, CFMCoreV2Config, get_preset
+    if preset is not None:
+        config = get_preset(preset)
+    elif config is None:
+        config = CFMCoreV2Config.default()
+    return CFMCoreV2(config=config)
+
+
+# Core type name -> constructor, dispatched with a single lookup
+_CORE_FACTORIES: Dict[str, Callable[[Optional[Any], Optional[str]], CFMCoreProtocol]] = {
+    "cfm": _create_v0,
+    "cfm_v0": _create_v0,
+    "cfm_v1": _create_v1,
+    "cfm_v2": _create_v2,
+}
 
 
 # Available CFM core types
@@ -52,32 +83,50 @@ def create_cfm_core(
     Raises:
         ValueError: If core_type is unknown
     """
-    core_type_lower = core_type.lower()
-
-    if core_type_lower not in CFM_CORE_TYPES:
+    factory = _CORE_FACTORIES.get(core_type.lower())
+    if factory is None:
         valid = ", ".join(CFM_CORE_TYPES.keys())
         raise ValueError(f"Unknown core type '{core_type}'. Valid types: {valid}")
+    return factory(config, preset)
 
-    # Create based on type
-    if core_type_lower in ("cfm", "cfm_v0"):
-        from cfm_core_v0 import CFMCore, CFMCoreConfig
-        if config is None:
-            config = CFMCoreConfig()
-        return CFMCore(config=config)
-
-    elif core_type_lower == "cfm_v1":
-        from cfm_core_v1 import CFMCoreV1, CFMCoreV1Config
-        if config is None:
-            config = CFMCoreV1Config()
-        return CFMCoreV1(config=config)
-
-    elif core_type_lower == "cfm_v2":
-        from cfm_core_v2 import CFMCoreV2, CFMCoreV2Config, get_preset
-        if preset is not None:
-            config = get_preset(preset)
-        elif config is None:
-            config = CFMCoreV2Config()
-        return CFMCoreV2(config=config)
 
+def create_cfm_ensemble(
+    core_type: str = "cfm_v2",
+    size: Optional[int] = None,
+    configs: Optional[Sequence[Any]] = None,
+    preset: Optional[str] = None,
+) -> CFMCoreEnsemble:
+    """
+    Create a lockstep ensemble of CFM cores of one type.
+
+    Args:
+        core_type: Type of core to create (see create_cfm_core)
+        size: Number of identically configured members (ignored if
+              configs is given)
+        configs: One configuration object per member, e.g. for a
+                 parameter sweep
+        preset: Optional preset name (for v2 only), applied to every member;
+                cannot be combined with configs
+
+    Returns:
+        CFMCoreEnsemble with one member per config (or size members)
+
+    Raises:
+        ValueError: If core_type is unknown, no members are requested, or
+                    both configs and preset are given
+    """
+    if configs is not None and preset is not None:
+        raise ValueError("Pass either configs or a preset, not both")
+    if configs is not None:
+        cores = [
+            create_cfm_core(core_type=core_type, config=config)
+            for config in configs
+        ]
+    elif size is not None and size > 0:
+        cores = [
+            create_cfm_core(core_type=core_type, preset=preset)
+            for _ in range(size)
+        ]
     else:
-        raise ValueError(f"Unknown core type: {core_type}")
+        raise ValueError("Either a positive size or a list of configs is required")
+    return CFMCoreEnsemble(cores)
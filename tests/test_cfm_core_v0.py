@@ -10,6 +10,7 @@ Comprehensive test suite covering:
 5. Safety invariants
 """
 
+import dataclasses
 import json
 import math
 import sys
@@ -23,8 +24,12 @@ from cfm_core_v0 import CFMCore, CFMCoreConfig, CFMCoreState
 from cfm_interface.adapters import CFMCoreAdapter
 from cfm_interface.config import CFMCoreInterfaceConfig
 from cfm_interface.protocols import CFMCoreProtocol
+from cfm_interface.ensemble import CFMCoreEnsemble, make_step_into
+from cfm_interface.factory import create_cfm_ensemble
 from cfm_consts import PHI, PSI
 
+_ADAPTER_CONFIG = CFMCoreInterfaceConfig(enabled=True)
+
 
 class TestCFMCoreConfig(unittest.TestCase):
     """Tests for CFMCoreConfig."""
@@ -44,6 +49,27 @@ class TestCFMCoreConfig(unittest.TestCase):
         self.assertIn("tau_energy", d)
         self.assertIn("omega_base", d)
 
+    def test_frozen(self):
+        """Test that configs are immutable and hashable."""
+        config = CFMCoreConfig()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.omega_base = 0.5
+        self.assertEqual(hash(config), hash(CFMCoreConfig()))
+        variant = dataclasses.replace(config, omega_base=0.5)
+        self.assertEqual(variant.omega_base, 0.5)
+
+    def test_replace_recomputes_derived_fields(self):
+        """Test that a replaced time constant reaches the dynamics."""
+        config = CFMCoreConfig()
+        variant = dataclasses.replace(config, tau_energy=2.0 * config.tau_energy)
+        self.assertEqual(variant._energy_tau, 2.0 * config._energy_tau)
+
+        # Start away from the energy target so tau_energy matters
+        state = CFMCoreState(energy=0.2)
+        base_outputs = CFMCore(config, initial_state=state).step_many(20, dt=0.1)
+        variant_outputs = CFMCore(variant, initial_state=state).step_many(20, dt=0.1)
+        self.assertNotEqual(variant_outputs["coherence"], base_outputs["coherence"])
+
 
 class TestCFMCoreState(unittest.TestCase):
     """Tests for CFMCoreState."""
@@ -68,6 +94,18 @@ class TestCFMCoreState(unittest.TestCase):
         state = CFMCoreState()
         self.assertTrue(state.validate())
 
+    def test_from_arrays_matches_constructor(self):
+        """Test batch construction applies the same validation."""
+        values = [(-0.5, 0.2, 1.5, 2.25), (0.3, 1.2, 0.7, -0.1), (0.5, 0.5, 0.5, 0.5)]
+        states = CFMCoreState.from_arrays(*zip(*values))
+        self.assertEqual(len(states), len(values))
+        for state, (c, i, e, p) in zip(states, values):
+            expected = CFMCoreState(coherence=c, instability=i, energy=e, phase=p)
+            self.assertEqual(state, expected)
+            self.assertTrue(state.validate())
+        with self.assertRaises(ValueError):
+            CFMCoreState.from_arrays([0.5], [0.5], [0.5], [])
+
 
 class TestCFMCoreInitialization(unittest.TestCase):
     """Tests for CFMCore initialization."""
@@ -83,6 +121,16 @@ class TestCFMCoreInitialization(unittest.TestCase):
         core = CFMCore()
         self.assertIsInstance(core, CFMCoreProtocol)
 
+    def test_replaced_config_takes_effect(self):
+        """Test that assigning a new config changes subsequent dynamics."""
+        config = CFMCoreConfig(omega_base=0.25, energy_target=0.9)
+        core1 = CFMCore()
+        core1.config = config
+        core2 = CFMCore(config)
+        for i in range(20):
+            self.assertEqual(core1.step(dt=0.1), core2.step(dt=0.1),
+                           f"Output mismatch at step {i}")
+
 
 class TestCFMCoreStep(unittest.TestCase):
     """Tests for CFMCore step behaviour."""
@@ -123,8 +171,7 @@ class TestCFMCoreStep(unittest.TestCase):
         for _ in range(500):
             result = self.core.step(dt=0.1)
             for key in ["coherence", "stability", "intensity", "alignment"]:
-                self.assertFalse(math.isnan(result[key]), f"{key} is NaN")
-                self.assertFalse(math.isinf(result[key]), f"{key} is Inf")
+                self.assertTrue(math.isfinite(result[key]), f"{key} is NaN or Inf")
 
 
 class TestCFMCoreDeterminism(unittest.TestCase):
@@ -153,6 +200,29 @@ class TestCFMCoreDeterminism(unittest.TestCase):
             self.assertEqual(r1["coherence"], r2["coherence"],
                            f"Coherence mismatch at step {i}")
 
+    def test_step_many_matches_step(self):
+        """Test that step_many reproduces repeated step calls exactly."""
+        core1 = CFMCore()
+        core2 = CFMCore()
+        results = [core1.step(dt=0.1) for _ in range(100)]
+        batch = core2.step_many(100, dt=0.1)
+        for key in ["coherence", "stability", "intensity", "alignment"]:
+            self.assertEqual(batch[key], [r[key] for r in results],
+                           f"{key} mismatch")
+        self.assertEqual(core1.get_state(), core2.get_state())
+
+    def test_step_into_matches_step(self):
+        """Test that step_into writes the same outputs as step."""
+        core1 = CFMCore()
+        core2 = CFMCore()
+        out = [0.0] * 4
+        for i in range(50):
+            result = core1.step(dt=0.1)
+            core2.step_into(out, dt=0.1)
+            self.assertEqual(out, [result["coherence"], result["stability"],
+                                   result["intensity"], result["alignment"]],
+                           f"Output mismatch at step {i}")
+
 
 class TestCFMCoreAdapterIntegration(unittest.TestCase):
     """Tests for CFMCore with CFMCoreAdapter."""
@@ -160,15 +230,13 @@ class TestCFMCoreAdapterIntegration(unittest.TestCase):
     def test_adapter_wraps_core(self):
         """Test that adapter can wrap CFMCore."""
         core = CFMCore()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
         self.assertIsNotNone(adapter)
 
     def test_adapter_step_returns_bundle(self):
         """Test that adapter step returns expected bundle structure."""
         core = CFMCore()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
         result = adapter.step(dt=0.1)
         self.assertIn("raw", result)
         self.assertIn("numeric_state", result)
@@ -177,8 +245,7 @@ class TestCFMCoreAdapterIntegration(unittest.TestCase):
     def test_adapter_numeric_state_bounded(self):
         """Test that adapter output numeric_state is bounded."""
         core = CFMCore()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
 
         for _ in range(100):
             result = adapter.step(dt=0.1)
@@ -189,8 +256,7 @@ class TestCFMCoreAdapterIntegration(unittest.TestCase):
     def test_adapter_json_serializable(self):
         """Test that adapter output is JSON serializable."""
         core = CFMCore()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
 
         for _ in range(20):
             result = adapter.step(dt=0.1)
@@ -201,6 +267,71 @@ class TestCFMCoreAdapterIntegration(unittest.TestCase):
                 self.fail(f"Output not JSON serializable: {e}")
 
 
+class TestCFMCoreEnsemble(unittest.TestCase):
+    """Tests for CFMCore ensembles."""
+
+    def test_ensemble_matches_independent_cores(self):
+        """Test that each member evolves exactly like a standalone core."""
+        configs = [CFMCoreConfig(omega_base=w) for w in (0.2, 0.4, 0.6)]
+        ensemble = create_cfm_ensemble("cfm", configs=configs)
+        cores = [CFMCore(config) for config in configs]
+        self.assertEqual(len(ensemble), 3)
+
+        for i in range(50):
+            outputs = ensemble.step(dt=0.1)
+            for index, core in enumerate(cores):
+                result = core.step(dt=0.1)
+                for key in ["coherence", "stability", "intensity", "alignment"]:
+                    self.assertEqual(outputs[key][index], result[key],
+                                   f"{key} mismatch for member {index} at step {i}")
+
+    def test_ensemble_step_many_matches_step(self):
+        """Test that batched ensemble stepping matches per-tick stepping."""
+        configs = [CFMCoreConfig(energy_target=e) for e in (0.3, 0.9)]
+        ensemble1 = create_cfm_ensemble("cfm", configs=configs)
+        ensemble2 = create_cfm_ensemble("cfm", configs=configs)
+        steps = [ensemble1.step(dt=0.1) for _ in range(40)]
+        batch = ensemble2.step_many(40, dt=0.1)
+        for key in ["coherence", "stability", "intensity", "alignment"]:
+            for index in range(len(configs)):
+                self.assertEqual(batch[key][index],
+                               [outputs[key][index] for outputs in steps],
+                               f"{key} mismatch for member {index}")
+
+    def test_make_step_into_falls_back_to_step(self):
+        """Test that cores without step_into() are unpacked from step()."""
+        class StepOnlyCore:
+            def __init__(self):
+                self.core = CFMCore()
+
+            def step(self, human_messages=None, external_events=None, dt=1.0):
+                return self.core.step(human_messages, external_events, dt)
+
+        wrapped = StepOnlyCore()
+        step_into = make_step_into(wrapped)
+        self.assertEqual(make_step_into(wrapped.core), wrapped.core.step_into)
+
+        reference = CFMCore()
+        out = [0.0] * 4
+        for _ in range(20):
+            step_into(out, external_events={"pulse": 0.1}, dt=0.1)
+            result = reference.step(external_events={"pulse": 0.1}, dt=0.1)
+            self.assertEqual(out, [result["coherence"], result["stability"],
+                                   result["intensity"], result["alignment"]])
+
+    def test_ensemble_requires_members(self):
+        """Test that empty ensembles are rejected."""
+        with self.assertRaises(ValueError):
+            CFMCoreEnsemble([])
+        with self.assertRaises(ValueError):
+            create_cfm_ensemble("cfm")
+
+    def test_ensemble_rejects_configs_with_preset(self):
+        """Test that explicit configs cannot be combined with a preset."""
+        with self.assertRaises(ValueError):
+            create_cfm_ensemble("cfm", configs=[CFMCoreConfig()], preset="baseline")
+
+
 class TestCFMCoreSafety(unittest.TestCase):
     """Tests for CFMCore safety invariants."""
 
@@ -23,9 +23,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cfm_core_v1 import CFMCoreV1, CFMCoreV1Config, CFMCoreV1State
 from cfm_interface.adapters import CFMCoreAdapter
 from cfm_interface.config import CFMCoreInterfaceConfig
+from cfm_interface.factory import create_cfm_ensemble
 from cfm_interface.protocols import CFMCoreProtocol
 from cfm_consts import PHI, PSI
 
+_ADAPTER_CONFIG = CFMCoreInterfaceConfig(enabled=True)
+
 
 class TestCFMCoreV1Config(unittest.TestCase):
     """Tests for CFMCoreV1Config."""
@@ -55,6 +58,14 @@ class TestCFMCoreV1Config(unittest.TestCase):
         self.assertIn("alignment_lock_strength", d)
         self.assertIn("coherence_decay_rate", d)
 
+    def test_to_dict_returns_independent_copies(self):
+        """Test the cached to_dict mapping cannot be modified by callers."""
+        config = CFMCoreV1Config()
+        d = config.to_dict()
+        d["max_dt"] = 99.0
+        self.assertEqual(config.to_dict()["max_dt"], 1.0)
+        self.assertEqual(CFMCoreV1(config).get_status()["config"], config.to_dict())
+
 
 class TestCFMCoreV1State(unittest.TestCase):
     """Tests for CFMCoreV1State."""
@@ -120,12 +131,29 @@ class TestCFMCoreV1Initialization(unittest.TestCase):
         self.assertEqual(core.config.tau_coherence, 5.0)
         self.assertEqual(core.config.tau_energy, 3.0)
 
+    def test_default_states_are_independent(self):
+        """Test that default-initialized and reset cores never share state."""
+        core1 = CFMCoreV1()
+        core2 = CFMCoreV1()
+        self.assertEqual(core1._state, CFMCoreV1State())
+        self.assertIsNot(core1._state, core2._state)
+        core1.step(dt=0.5)
+        core1.reset()
+        self.assertEqual(core1._state, CFMCoreV1State())
+        self.assertEqual(core2._state, CFMCoreV1State())
+
 
 class TestCFMCoreV1Step(unittest.TestCase):
     """Tests for CFMCoreV1 step behaviour."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Configs are frozen, so one validated instance serves every test
+        cls.config = CFMCoreV1Config()
+
     def setUp(self):
-        self.core = CFMCoreV1()
+        # Each test still gets a fresh core with its own default state
+        self.core = CFMCoreV1(self.config)
 
     def test_step_returns_dict(self):
         """Test that step returns a dictionary."""
@@ -160,8 +188,7 @@ class TestCFMCoreV1Step(unittest.TestCase):
         for _ in range(500):
             result = self.core.step(dt=0.1)
             for key in ["coherence", "stability", "intensity", "alignment"]:
-                self.assertFalse(math.isnan(result[key]), f"{key} is NaN")
-                self.assertFalse(math.isinf(result[key]), f"{key} is Inf")
+                self.assertTrue(math.isfinite(result[key]), f"{key} is NaN or Inf")
 
     def test_version_in_output(self):
         """Test that v1 includes version metadata."""
@@ -204,6 +231,29 @@ class TestCFMCoreV1Determinism(unittest.TestCase):
             self.assertEqual(r1["coherence"], r2["coherence"],
                            f"Coherence mismatch at step {i}")
 
+    def test_step_many_matches_step(self):
+        """Test that step_many reproduces repeated step calls exactly."""
+        core1 = CFMCoreV1()
+        core2 = CFMCoreV1()
+        results = [core1.step(dt=0.1) for _ in range(100)]
+        batch = core2.step_many(100, dt=0.1)
+        for key in ["coherence", "stability", "intensity", "alignment"]:
+            self.assertEqual(batch[key], [r[key] for r in results],
+                           f"{key} mismatch")
+        self.assertEqual(core1.get_state(), core2.get_state())
+
+    def test_step_into_matches_step(self):
+        """Test that step_into writes the same outputs as step."""
+        core1 = CFMCoreV1()
+        core2 = CFMCoreV1()
+        out = [0.0] * 4
+        for i in range(50):
+            result = core1.step(dt=0.1)
+            core2.step_into(out, dt=0.1)
+            self.assertEqual(out, [result["coherence"], result["stability"],
+                                   result["intensity"], result["alignment"]],
+                           f"Output mismatch at step {i}")
+
 
 class TestCFMCoreV1AdapterIntegration(unittest.TestCase):
     """Tests for CFMCoreV1 with CFMCoreAdapter."""
@@ -211,15 +261,13 @@ class TestCFMCoreV1AdapterIntegration(unittest.TestCase):
     def test_adapter_wraps_core(self):
         """Test that adapter can wrap CFMCoreV1."""
         core = CFMCoreV1()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
         self.assertIsNotNone(adapter)
 
     def test_adapter_step_returns_bundle(self):
         """Test that adapter step returns expected bundle structure."""
         core = CFMCoreV1()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
         result = adapter.step(dt=0.1)
         self.assertIn("raw", result)
         self.assertIn("numeric_state", result)
@@ -228,8 +276,7 @@ class TestCFMCoreV1AdapterIntegration(unittest.TestCase):
     def test_adapter_numeric_state_bounded(self):
         """Test that adapter output numeric_state is bounded."""
         core = CFMCoreV1()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
 
         for _ in range(100):
             result = adapter.step(dt=0.1)
@@ -240,8 +287,7 @@ class TestCFMCoreV1AdapterIntegration(unittest.TestCase):
     def test_adapter_json_serializable(self):
         """Test that adapter output is JSON serializable."""
         core = CFMCoreV1()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
 
         for _ in range(20):
             result = adapter.step(dt=0.1)
@@ -252,6 +298,36 @@ class TestCFMCoreV1AdapterIntegration(unittest.TestCase):
                 self.fail(f"Output not JSON serializable: {e}")
 
 
+class TestCFMCoreV1Ensemble(unittest.TestCase):
+    """Tests for CFMCoreV1 ensembles."""
+
+    def test_ensemble_members_match_single_core(self):
+        """Test that every member of a uniform ensemble matches a lone core."""
+        ensemble = create_cfm_ensemble("cfm_v1", size=4)
+        core = CFMCoreV1()
+        self.assertEqual(len(ensemble), 4)
+
+        for i in range(50):
+            outputs = ensemble.step(dt=0.1)
+            result = core.step(dt=0.1)
+            for key in ["coherence", "stability", "intensity", "alignment"]:
+                self.assertEqual(outputs[key], [result[key]] * 4,
+                               f"{key} mismatch at step {i}")
+
+    def test_ensemble_step_many_matches_step(self):
+        """Test that batched ensemble stepping matches per-tick stepping."""
+        configs = [CFMCoreV1Config(omega_phase=w) for w in (0.3, 0.7)]
+        ensemble1 = create_cfm_ensemble("cfm_v1", configs=configs)
+        ensemble2 = create_cfm_ensemble("cfm_v1", configs=configs)
+        steps = [ensemble1.step(dt=0.1) for _ in range(40)]
+        batch = ensemble2.step_many(40, dt=0.1)
+        for key in ["coherence", "stability", "intensity", "alignment"]:
+            for index in range(len(configs)):
+                self.assertEqual(batch[key][index],
+                               [outputs[key][index] for outputs in steps],
+                               f"{key} mismatch for member {index}")
+
+
 class TestCFMCoreV1Safety(unittest.TestCase):
     """Tests for CFMCoreV1 safety invariants."""
 
@@ -331,13 +407,14 @@ class TestCFMCoreV1Dynamics(unittest.TestCase):
     def test_long_run_stability(self):
         """Test that v1 remains stable over long runs."""
         core = CFMCoreV1()
-        for i in range(2000):
-            result = core.step(dt=0.1)
-            for key in ["coherence", "stability", "intensity", "alignment"]:
-                self.assertGreaterEqual(result[key], 0.0)
-                self.assertLessEqual(result[key], 1.0)
-                self.assertFalse(math.isnan(result[key]))
-                self.assertFalse(math.isinf(result[key]))
+        # step_many is checked against repeated step() calls above
+        outputs = core.step_many(2000, dt=0.1)
+        for key in ["coherence", "stability", "intensity", "alignment"]:
+            values = outputs[key]
+            self.assertEqual(len(values), 2000)
+            self.assertTrue(all(map(math.isfinite, values)), key)
+            self.assertGreaterEqual(min(values), 0.0, key)
+            self.assertLessEqual(max(values), 1.0, key)
 
 
 class TestCFMCoreV1StatusMethods(unittest.TestCase):
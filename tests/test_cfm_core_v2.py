@@ -6,6 +6,8 @@ Comprehensive test suite covering multi-channel architecture,
 attractor basin dynamics, and five-tier timescale hierarchy.
 """
 
+import copy
+import dataclasses
 import json
 import math
 import sys
@@ -16,11 +18,15 @@ import unittest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cfm_core_v2 import CFMCoreV2, CFMCoreV2Config, CFMCoreV2State
+from cfm_core_v2 import CFM_V2_PRESETS, get_preset, list_presets
 from cfm_interface.adapters import CFMCoreAdapter
+from cfm_interface.factory import create_cfm_ensemble
 from cfm_interface.config import CFMCoreInterfaceConfig
 from cfm_interface.protocols import CFMCoreProtocol
 from cfm_consts import PHI, PSI
 
+_ADAPTER_CONFIG = CFMCoreInterfaceConfig(enabled=True)
+
 
 class TestCFMCoreV2Config(unittest.TestCase):
     """Tests for CFMCoreV2Config."""
@@ -50,6 +56,61 @@ class TestCFMCoreV2Config(unittest.TestCase):
         self.assertIn("basin_center_c", d)
         self.assertIn("coherence_energy_coupling", d)
 
+    def test_to_dict_returns_independent_copies(self):
+        """Test the cached to_dict mapping cannot be modified by callers."""
+        config = CFMCoreV2Config()
+        d = config.to_dict()
+        d["max_dt"] = 99.0
+        self.assertEqual(config.to_dict()["max_dt"], 1.0)
+        self.assertEqual(config.replace(max_dt=0.5).to_dict()["max_dt"], 0.5)
+
+    def test_frozen(self):
+        """Test that configs are immutable, hashable and derivable."""
+        config = CFMCoreV2Config()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.tau_slow = 1.0
+        self.assertEqual(hash(config), hash(CFMCoreV2Config()))
+        variant = dataclasses.replace(config, basin_radius=0.5)
+        self.assertEqual(variant.basin_radius, 0.5)
+        self.assertEqual(variant._basin_radius_outer, 0.5 * PHI)
+
+    def test_default_is_shared_and_equal(self):
+        """Test default() returns one shared instance equal to the defaults."""
+        config = CFMCoreV2Config.default()
+        self.assertIs(CFMCoreV2Config.default(), config)
+        self.assertEqual(config, CFMCoreV2Config())
+        self.assertIs(CFMCoreV2().config, config)
+
+    def test_replace_derives_validated_variant(self):
+        """Test replace() leaves the original and shared presets untouched."""
+        preset = get_preset("baseline")
+        variant = preset.replace(tau_fast=2.0, energy_target=1.5)
+        self.assertEqual(variant.tau_fast, 2.0)
+        self.assertEqual(variant.energy_target, 1.0)
+        self.assertEqual(get_preset("baseline"), CFMCoreV2Config())
+
+
+class TestCFMCoreV2Presets(unittest.TestCase):
+    """Tests for CFM v2 preset lookup."""
+
+    def test_get_preset_returns_shared_instance(self):
+        """Test that name variants resolve to the registered preset."""
+        preset = get_preset("high_stability")
+        self.assertIs(preset, CFM_V2_PRESETS["high_stability"])
+        self.assertIs(get_preset("High-Stability"), preset)
+        self.assertIs(get_preset("high stability"), preset)
+
+    def test_module_constants_match_registry(self):
+        """Test the lazily built preset constants are the shared instances."""
+        from cfm_core_v2 import CFM_V2_PRESET_PULSED_ACTIVITY
+        self.assertIs(CFM_V2_PRESET_PULSED_ACTIVITY, get_preset("pulsed_activity"))
+        self.assertEqual(sorted(CFM_V2_PRESETS), sorted(list_presets()))
+
+    def test_unknown_preset_raises(self):
+        """Test that unknown names raise ValueError."""
+        with self.assertRaises(ValueError):
+            get_preset("nonexistent")
+
 
 class TestCFMCoreV2State(unittest.TestCase):
     """Tests for CFMCoreV2State."""
@@ -81,6 +142,16 @@ class TestCFMCoreV2State(unittest.TestCase):
         state = CFMCoreV2State()
         self.assertTrue(state.validate())
 
+    def test_get_state_is_independent_copy(self):
+        """Test get_state returns an equal copy detached from the core."""
+        core = CFMCoreV2()
+        core.step(dt=0.1)
+        state = core.get_state()
+        self.assertEqual(state, core._state)
+        self.assertIsNot(state, core._state)
+        state.coherence_slow = 0.0
+        self.assertNotEqual(core._state.coherence_slow, 0.0)
+
     def test_channel_getters(self):
         """Test channel getter methods."""
         state = CFMCoreV2State(coherence_slow=0.5, coherence_fast=0.6)
@@ -88,6 +159,36 @@ class TestCFMCoreV2State(unittest.TestCase):
         self.assertEqual(coherence["slow"], 0.5)
         self.assertEqual(coherence["fast"], 0.6)
 
+    def test_from_dict_matches_constructor(self):
+        """Test from_dict round-trips and validates like the constructor."""
+        core = CFMCoreV2()
+        core.step_many(50, dt=0.1)
+        state = core.get_state()
+        self.assertEqual(CFMCoreV2State.from_dict(state.to_dict()), state)
+
+        # Every field out of range, alternating above and below
+        data = {
+            "coherence_slow": 1.5, "coherence_fast": -0.5,
+            "energy_potential": 2.0, "energy_flux": -0.2,
+            "stability_envelope": 1.1, "instability_pulse": -1.0,
+            "phase_global": -0.25, "phase_local": 2.25,
+            "alignment_field": 3.0, "alignment_direction": -3.0,
+            "resonance_index": 1.01, "time": -1.0, "step_count": -5,
+        }
+        self.assertEqual(CFMCoreV2State.from_dict(data), CFMCoreV2State(**data))
+        self.assertEqual(CFMCoreV2State.from_dict({**data, "unknown": 1.0}),
+                         CFMCoreV2State(**data))
+        self.assertEqual(CFMCoreV2State.from_dict({}), CFMCoreV2State())
+
+    def test_as_tuple(self):
+        """Test as_tuple returns the channel variables in field order."""
+        state = CFMCoreV2State(coherence_slow=0.5, resonance_index=0.2, time=3.0)
+        values = state.as_tuple()
+        self.assertEqual(len(values), 11)
+        self.assertEqual(values[0], 0.5)
+        self.assertEqual(values[-1], 0.2)
+        self.assertNotIn(3.0, values)
+
     def test_distance_to_basin(self):
         """Test basin distance calculation."""
         state = CFMCoreV2State()
@@ -149,8 +250,7 @@ class TestCFMCoreV2Step(unittest.TestCase):
         for _ in range(500):
             result = self.core.step(dt=0.1)
             for key in ["coherence", "stability", "intensity", "alignment"]:
-                self.assertFalse(math.isnan(result[key]), f"{key} is NaN")
-                self.assertFalse(math.isinf(result[key]), f"{key} is Inf")
+                self.assertTrue(math.isfinite(result[key]), f"{key} is NaN or Inf")
 
     def test_version_in_output(self):
         """Test that v2 includes version metadata."""
@@ -190,6 +290,40 @@ class TestCFMCoreV2Determinism(unittest.TestCase):
             self.assertEqual(r1["coherence"], r2["coherence"],
                            f"Coherence mismatch at step {i}")
 
+    def test_step_many_matches_step(self):
+        """Test that step_many reproduces repeated step calls exactly."""
+        core1 = CFMCoreV2()
+        core2 = CFMCoreV2()
+        results = [core1.step(dt=0.1) for _ in range(100)]
+        batch = core2.step_many(100, dt=0.1)
+        for key in ["coherence", "stability", "intensity", "alignment"]:
+            self.assertEqual(batch[key], [r[key] for r in results],
+                           f"{key} mismatch")
+        self.assertEqual(core1.get_state(), core2.get_state())
+
+    def test_step_into_matches_step(self):
+        """Test that step_into writes the same outputs as step."""
+        core1 = CFMCoreV2()
+        core2 = CFMCoreV2()
+        out = [0.0] * 4
+        for i in range(50):
+            result = core1.step(dt=0.1)
+            core2.step_into(out, dt=0.1)
+            expected = [result["coherence"], result["stability"],
+                        result["intensity"], result["alignment"]]
+            self.assertEqual(out, expected, f"Output mismatch at step {i}")
+
+    def test_identical_ensemble_members(self):
+        """Test that identically configured members advance in lockstep."""
+        ensemble = create_cfm_ensemble("cfm_v2", size=3)
+        batch = ensemble.step_many(200, dt=0.1)
+        expected = CFMCoreV2().step_many(200, dt=0.1)
+        for key in ["coherence", "stability", "intensity", "alignment"]:
+            self.assertEqual(batch[key], [expected[key]] * 3, f"{key} mismatch")
+        states = [core.get_state() for core in ensemble.cores]
+        self.assertEqual(states[0], states[1])
+        self.assertEqual(states[0], states[2])
+
 
 class TestCFMCoreV2AdapterIntegration(unittest.TestCase):
     """Tests for CFMCoreV2 with CFMCoreAdapter."""
@@ -197,15 +331,13 @@ class TestCFMCoreV2AdapterIntegration(unittest.TestCase):
     def test_adapter_wraps_core(self):
         """Test that adapter can wrap CFMCoreV2."""
         core = CFMCoreV2()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
         self.assertIsNotNone(adapter)
 
     def test_adapter_numeric_state_bounded(self):
         """Test that adapter output numeric_state is bounded."""
         core = CFMCoreV2()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
 
         for _ in range(100):
             result = adapter.step(dt=0.1)
@@ -216,8 +348,7 @@ class TestCFMCoreV2AdapterIntegration(unittest.TestCase):
     def test_adapter_json_serializable(self):
         """Test that adapter output is JSON serializable."""
         core = CFMCoreV2()
-        adapter_config = CFMCoreInterfaceConfig(enabled=True)
-        adapter = CFMCoreAdapter(core=core, config=adapter_config)
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
 
         for _ in range(20):
             result = adapter.step(dt=0.1)
@@ -227,6 +358,74 @@ class TestCFMCoreV2AdapterIntegration(unittest.TestCase):
             except (TypeError, ValueError) as e:
                 self.fail(f"Output not JSON serializable: {e}")
 
+    def test_adapter_normalizes_non_finite_values(self):
+        """Test that NaN, infinite and non-numeric outputs map to 0.0."""
+        adapter = CFMCoreAdapter(core=CFMCoreV2())
+        raw = {
+            "coherence": float("nan"),
+            "stability": float("inf"),
+            "intensity": "not a number",
+            "alignment": 2.0,
+        }
+        numeric_state = adapter._extract_numeric_state(raw)
+        self.assertEqual(numeric_state["coherence"], 0.0)
+        self.assertEqual(numeric_state["stability"], 0.0)
+        self.assertEqual(numeric_state["intensity"], 0.0)
+        self.assertEqual(numeric_state["alignment"], 1.0)
+
+    def test_adapter_raw_is_detached_copy(self):
+        """Test that the raw output is a copy of the core's result."""
+        core = CFMCoreV2()
+        adapter = CFMCoreAdapter(core=core, config=_ADAPTER_CONFIG)
+
+        raw = {"coherence": 0.5, "nested": {"values": [0.1, 0.2]}}
+        copied = adapter._safe_copy(raw)
+        self.assertEqual(copied, raw)
+        copied["nested"]["values"].append(0.3)
+        self.assertEqual(raw["nested"]["values"], [0.1, 0.2])
+
+    def test_adapter_copy_matches_deepcopy(self):
+        """Test the flat-dict fast path and fallback agree with deepcopy."""
+        adapter = CFMCoreAdapter(core=CFMCoreV2())
+        cases = [
+            CFMCoreV2().step(dt=0.1),
+            {"coherence": float("nan"), "stability": float("-inf")},
+            {1: 0.5, "label": None, "flag": True},
+            {"history": (0.1, 0.2), "nested": {"values": [float("inf")]}},
+        ]
+        for raw in cases:
+            copied = adapter._safe_copy(raw)
+            self.assertIsNot(copied, raw)
+            self.assertEqual(repr(copied), repr(copy.deepcopy(raw)))
+
+
+class TestCFMCoreV2Ensemble(unittest.TestCase):
+    """Tests for CFMCoreV2 ensembles."""
+
+    def test_preset_sweep_matches_independent_cores(self):
+        """Test that a sweep over all presets matches standalone cores."""
+        configs = list(CFM_V2_PRESETS.values())
+        ensemble = create_cfm_ensemble("cfm_v2", configs=configs)
+        self.assertEqual(len(ensemble), len(configs))
+
+        outputs = [ensemble.step(dt=0.1) for _ in range(30)]
+        batch = ensemble.step_many(70, dt=0.1)
+        for index, config in enumerate(configs):
+            core = CFMCoreV2(config)
+            results = [core.step(dt=0.1) for _ in range(100)]
+            for key in ["coherence", "stability", "intensity", "alignment"]:
+                trajectory = [step[key][index] for step in outputs] + batch[key][index]
+                self.assertEqual(trajectory, [r[key] for r in results],
+                               f"{key} mismatch for member {index}")
+
+    def test_preset_applies_to_sized_ensemble(self):
+        """Test that a preset configures every member of a sized ensemble."""
+        ensemble = create_cfm_ensemble("cfm_v2", size=2, preset="high_stability")
+        for core in ensemble.cores:
+            self.assertEqual(core.config, get_preset("high_stability"))
+        with self.assertRaises(ValueError):
+            create_cfm_ensemble("cfm_v2", configs=[CFMCoreV2Config()], preset="high_stability")
+
 
 class TestCFMCoreV2Safety(unittest.TestCase):
     """Tests for CFMCoreV2 safety invariants."""
@@ -249,17 +448,17 @@ class TestCFMCoreV2Safety(unittest.TestCase):
         for i in range(500):
             core.step(dt=0.1)
             state = core.get_state()
-            self.assertTrue(0.0 <= state.coherence_slow <= 1.0)
-            self.assertTrue(0.0 <= state.coherence_fast <= 1.0)
-            self.assertTrue(0.0 <= state.energy_potential <= 1.0)
-            self.assertTrue(0.0 <= state.energy_flux <= 1.0)
-            self.assertTrue(0.0 <= state.stability_envelope <= 1.0)
-            self.assertTrue(0.0 <= state.instability_pulse <= 1.0)
-            self.assertTrue(0.0 <= state.alignment_field <= 1.0)
-            self.assertTrue(0.0 <= state.alignment_direction <= 1.0)
-            self.assertTrue(0.0 <= state.resonance_index <= 1.0)
-            self.assertTrue(0.0 <= state.phase_global < 1.0)
-            self.assertTrue(0.0 <= state.phase_local < 1.0)
+            self.assertTrue(0.0 <= state.coherence_slow <= 1.0, f"Step {i}: coherence_slow")
+            self.assertTrue(0.0 <= state.coherence_fast <= 1.0, f"Step {i}: coherence_fast")
+            self.assertTrue(0.0 <= state.energy_potential <= 1.0, f"Step {i}: energy_potential")
+            self.assertTrue(0.0 <= state.energy_flux <= 1.0, f"Step {i}: energy_flux")
+            self.assertTrue(0.0 <= state.stability_envelope <= 1.0, f"Step {i}: stability_envelope")
+            self.assertTrue(0.0 <= state.instability_pulse <= 1.0, f"Step {i}: instability_pulse")
+            self.assertTrue(0.0 <= state.alignment_field <= 1.0, f"Step {i}: alignment_field")
+            self.assertTrue(0.0 <= state.alignment_direction <= 1.0, f"Step {i}: alignment_direction")
+            self.assertTrue(0.0 <= state.resonance_index <= 1.0, f"Step {i}: resonance_index")
+            self.assertTrue(0.0 <= state.phase_global < 1.0, f"Step {i}: phase_global")
+            self.assertTrue(0.0 <= state.phase_local < 1.0, f"Step {i}: phase_local")
 
 
 class TestCFMCoreV2Dynamics(unittest.TestCase):
@@ -299,10 +498,9 @@ class TestCFMCoreV2Dynamics(unittest.TestCase):
         for i in range(2000):
             result = core.step(dt=0.1)
             for key in ["coherence", "stability", "intensity", "alignment"]:
-                self.assertGreaterEqual(result[key], 0.0)
-                self.assertLessEqual(result[key], 1.0)
-                self.assertFalse(math.isnan(result[key]))
-                self.assertFalse(math.isinf(result[key]))
+                self.assertGreaterEqual(result[key], 0.0, f"Step {i}: {key} below 0")
+                self.assertLessEqual(result[key], 1.0, f"Step {i}: {key} above 1")
+                self.assertTrue(math.isfinite(result[key]), f"Step {i}: {key} is NaN or Inf")
 
 
 class TestCFMCoreV2StatusMethods(unittest.TestCase):
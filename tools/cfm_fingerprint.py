@@ -30,7 +30,7 @@ PHI_INV = 1.0 / PHI
 
 def compute_stats(values: List[float]) -> Dict[str, float]:
     """Compute basic statistics for a list of values."""
-    valid = [v for v in values if isinstance(v, (int, float)) and not (math.isnan(v) or math.isinf(v))]
+    valid = [v for v in values if isinstance(v, (int, float)) and math.isfinite(v)]
 
     if not valid:
         return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0, "range": 0.0}
@@ -39,13 +39,15 @@ def compute_stats(values: List[float]) -> Dict[str, float]:
     mean = sum(valid) / n
     variance = sum((v - mean) ** 2 for v in valid) / n if n > 1 else 0.0
     std = math.sqrt(variance)
+    lo = min(valid)
+    hi = max(valid)
 
     return {
         "mean": mean,
         "std": std,
-        "min": min(valid),
-        "max": max(valid),
-        "range": max(valid) - min(valid),
+        "min": lo,
+        "max": hi,
+        "range": hi - lo,
     }
 
 
@@ -76,42 +78,110 @@ def extract_fingerprint(run_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _numeric_difference(path: str, val1: float, val2: float) -> Optional[Dict[str, Any]]:
+    """Return a numeric_difference record if two numbers differ by more than 1e-6."""
+    if abs(val1 - val2) > 1e-6:
+        rel_diff = abs(val1 - val2) / max(abs(val1), abs(val2), 1e-10)
+        return {
+            "path": path,
+            "type": "numeric_difference",
+            "value1": val1,
+            "value2": val2,
+            "abs_diff": abs(val1 - val2),
+            "rel_diff": rel_diff,
+        }
+    return None
+
+
 def compare_values(val1: Any, val2: Any, path: str = "") -> List[Dict[str, Any]]:
-    """Recursively compare two values and return differences."""
+    """
+    Compare two nested values and return differences.
+
+    Walks dicts (in sorted key order) and lists depth-first with an
+    explicit stack, appending every difference to a single output list.
+    Stack entries are either (val1, val2, path) pairs still to compare or
+    ready difference records, which keeps missing-key records in order
+    with the differences found below their sibling keys.
+    """
     differences = []
-
-    if isinstance(val1, dict) and isinstance(val2, dict):
-        all_keys = set(val1.keys()) | set(val2.keys())
-        for key in sorted(all_keys):
-            new_path = f"{path}.{key}" if path else key
-            if key not in val1:
-                differences.append({"path": new_path, "type": "missing_in_first", "value2": val2[key]})
-            elif key not in val2:
-                differences.append({"path": new_path, "type": "missing_in_second", "value1": val1[key]})
+    stack: List[Any] = [(val1, val2, path)]
+
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, dict):
+            differences.append(entry)
+            continue
+        val1, val2, path = entry
+
+        if isinstance(val1, dict) and isinstance(val2, dict):
+            all_keys = set(val1.keys()) | set(val2.keys())
+            for key in sorted(all_keys, reverse=True):
+                new_path = f"{path}.{key}" if path else key
+                if key not in val1:
+                    stack.append({"path": new_path, "type": "missing_in_first", "value2": val2[key]})
+                elif key not in val2:
+                    stack.append({"path": new_path, "type": "missing_in_second", "value1": val1[key]})
+                else:
+                    stack.append((val1[key], val2[key], new_path))
+
+        elif isinstance(val1, list) and isinstance(val2, list):
+            if len(val1) != len(val2):
+                differences.append({"path": path, "type": "length_mismatch", "len1": len(val1), "len2": len(val2)})
             else:
-                differences.extend(compare_values(val1[key], val2[key], new_path))
+                for i in range(len(val1) - 1, -1, -1):
+                    stack.append((val1[i], val2[i], f"{path}[{i}]"))
 
-    elif isinstance(val1, list) and isinstance(val2, list):
-        if len(val1) != len(val2):
-            differences.append({"path": path, "type": "length_mismatch", "len1": len(val1), "len2": len(val2)})
-        else:
-            for i, (v1, v2) in enumerate(zip(val1, val2)):
-                differences.extend(compare_values(v1, v2, f"{path}[{i}]"))
-
-    elif isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
-        if abs(val1 - val2) > 1e-6:
-            rel_diff = abs(val1 - val2) / max(abs(val1), abs(val2), 1e-10)
-            differences.append({
-                "path": path,
-                "type": "numeric_difference",
-                "value1": val1,
-                "value2": val2,
-                "abs_diff": abs(val1 - val2),
-                "rel_diff": rel_diff,
-            })
-
-    elif val1 != val2:
-        differences.append({"path": path, "type": "value_mismatch", "value1": val1, "value2": val2})
+        elif isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
+            diff = _numeric_difference(path, val1, val2)
+            if diff is not None:
+                differences.append(diff)
+
+        elif val1 != val2:
+            differences.append({"path": path, "type": "value_mismatch", "value1": val1, "value2": val2})
+
+    return differences
+
+
+# Layout of common_metrics as built by extract_common_fingerprint, in the
+# sorted key order compare_values() visits
+_COMMON_CHANNELS = ("alignment", "coherence", "intensity", "stability")
+_COMMON_STATS = ("max", "mean", "min", "range", "std")
+_COMMON_CHANNEL_KEYS = frozenset(_COMMON_CHANNELS)
+_COMMON_STAT_KEYS = frozenset(_COMMON_STATS)
+
+
+def _compare_common_metrics(
+    metrics1: Any, metrics2: Any, path: str
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Compare two common_metrics blocks with the known channel/stat layout.
+
+    Returns the same differences as compare_values() would, or None if
+    either block deviates from the layout (the caller then falls back to
+    the generic walk).
+    """
+    if not (isinstance(metrics1, dict) and isinstance(metrics2, dict)):
+        return None
+    if metrics1.keys() != _COMMON_CHANNEL_KEYS or metrics2.keys() != _COMMON_CHANNEL_KEYS:
+        return None
+
+    differences = []
+    for channel in _COMMON_CHANNELS:
+        stats1 = metrics1[channel]
+        stats2 = metrics2[channel]
+        if not (isinstance(stats1, dict) and isinstance(stats2, dict)):
+            return None
+        if stats1.keys() != _COMMON_STAT_KEYS or stats2.keys() != _COMMON_STAT_KEYS:
+            return None
+
+        for stat in _COMMON_STATS:
+            val1 = stats1[stat]
+            val2 = stats2[stat]
+            if not (isinstance(val1, (int, float)) and isinstance(val2, (int, float))):
+                return None
+            diff = _numeric_difference(f"{path}.{channel}.{stat}", val1, val2)
+            if diff is not None:
+                differences.append(diff)
 
     return differences
 
@@ -121,11 +191,11 @@ def compare_fingerprints(fp1: Dict[str, Any], fp2: Dict[str, Any]) -> Dict[str,
     core_type_match = fp1.get("core_type") == fp2.get("core_type")
     scenario_match = fp1.get("scenario") == fp2.get("scenario")
 
-    common_diffs = compare_values(
-        fp1.get("common_metrics", {}),
-        fp2.get("common_metrics", {}),
-        "common_metrics"
-    )
+    common1 = fp1.get("common_metrics", {})
+    common2 = fp2.get("common_metrics", {})
+    common_diffs = _compare_common_metrics(common1, common2, "common_metrics")
+    if common_diffs is None:
+        common_diffs = compare_values(common1, common2, "common_metrics")
 
     specific_diffs = compare_values(
         fp1.get("core_specific", {}),
@@ -28,6 +28,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cfm_interface import create_cfm_core, list_core_types
 
+# Steps between progress lines in verbose runs
+PROGRESS_INTERVAL = 100
+
 
 def run_cfm_loop(
     core_type: str = "cfm_v2",
@@ -52,30 +55,61 @@ def run_cfm_loop(
     # Create core
     core = create_cfm_core(core_type=core_type, preset=preset)
 
-    # Initialize trajectories
-    trajectories: Dict[str, List[float]] = {
-        "coherence": [],
-        "stability": [],
-        "intensity": [],
-        "alignment": [],
-    }
-
-    # Run loop
-    for step in range(num_steps):
-        result = core.step(dt=dt)
-
-        # Capture trajectory
-        trajectories["coherence"].append(result.get("coherence", 0.0))
-        trajectories["stability"].append(result.get("stability", 0.0))
-        trajectories["intensity"].append(result.get("intensity", 0.0))
-        trajectories["alignment"].append(result.get("alignment", 0.0))
-
-        if verbose and (step + 1) % 100 == 0:
-            print(f"Step {step + 1}/{num_steps}: "
-                  f"C={result['coherence']:.4f} "
-                  f"S={result['stability']:.4f} "
-                  f"I={result['intensity']:.4f} "
-                  f"A={result['alignment']:.4f}")
+    # Cores with step_many() run in batches: the whole run at once, or one
+    # progress interval at a time when verbose. The per-step loop is only
+    # needed for cores without step_many().
+    step_many = getattr(core, "step_many", None)
+    if step_many is not None and not verbose:
+        trajectories: Dict[str, List[float]] = step_many(num_steps, dt)
+    elif step_many is not None:
+        trajectories = {
+            "coherence": [],
+            "stability": [],
+            "intensity": [],
+            "alignment": [],
+        }
+
+        for start in range(0, num_steps, PROGRESS_INTERVAL):
+            chunk = step_many(min(PROGRESS_INTERVAL, num_steps - start), dt)
+            for key, values in trajectories.items():
+                values.extend(chunk[key])
+
+            done = len(trajectories["coherence"])
+            if done % PROGRESS_INTERVAL == 0:
+                print(f"Step {done}/{num_steps}: "
+                      f"C={chunk['coherence'][-1]:.4f} "
+                      f"S={chunk['stability'][-1]:.4f} "
+                      f"I={chunk['intensity'][-1]:.4f} "
+                      f"A={chunk['alignment'][-1]:.4f}")
+    else:
+        # Preallocated per-channel buffers, filled by index
+        coherence = [0.0] * num_steps
+        stability = [0.0] * num_steps
+        intensity = [0.0] * num_steps
+        alignment = [0.0] * num_steps
+
+        for step in range(num_steps):
+            result = core.step(dt=dt)
+
+            # Capture trajectory
+            coherence[step] = result.get("coherence", 0.0)
+            stability[step] = result.get("stability", 0.0)
+            intensity[step] = result.get("intensity", 0.0)
+            alignment[step] = result.get("alignment", 0.0)
+
+            if verbose and (step + 1) % PROGRESS_INTERVAL == 0:
+                print(f"Step {step + 1}/{num_steps}: "
+                      f"C={result['coherence']:.4f} "
+                      f"S={result['stability']:.4f} "
+                      f"I={result['intensity']:.4f} "
+                      f"A={result['alignment']:.4f}")
+
+        trajectories = {
+            "coherence": coherence,
+            "stability": stability,
+            "intensity": intensity,
+            "alignment": alignment,
+        }
 
     # Build output
     return {
@@ -89,10 +123,8 @@ def run_cfm_loop(
         },
         "trajectories": trajectories,
         "final_state": {
-            "coherence": trajectories["coherence"][-1] if trajectories["coherence"] else 0.0,
-            "stability": trajectories["stability"][-1] if trajectories["stability"] else 0.0,
-            "intensity": trajectories["intensity"][-1] if trajectories["intensity"] else 0.0,
-            "alignment": trajectories["alignment"][-1] if trajectories["alignment"] else 0.0,
+            key: trajectories[key][-1] if trajectories[key] else 0.0
+            for key in ("coherence", "stability", "intensity", "alignment")
         },
     }
 
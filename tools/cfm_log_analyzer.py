@@ -20,12 +20,16 @@ Features:
 """
 
 import argparse
+import io
 import json
 import math
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from functools import partial
+from itertools import chain
+from typing import Dict, Any, List, Optional, TextIO, Tuple
 
 
 # ==============================================================================
@@ -62,16 +66,16 @@ def compute_stats(values: List[float]) -> Dict[str, Any]:
         if not isinstance(v, (int, float)):
             continue
 
-        if math.isnan(v):
-            nan_count += 1
-        elif math.isinf(v):
-            inf_count += 1
-        else:
+        if math.isfinite(v):
             valid.append(v)
             if v < 0.0:
                 below_zero += 1
             elif v > 1.0:
                 above_one += 1
+        elif v != v:
+            nan_count += 1
+        else:
+            inf_count += 1
 
     if not valid:
         return {
@@ -108,12 +112,18 @@ def compute_stats(values: List[float]) -> Dict[str, Any]:
 # ANALYZER
 # ==============================================================================
 
-def analyze_run(run_data: Dict[str, Any]) -> Dict[str, Any]:
+def analyze_run(
+    run_data: Dict[str, Any],
+    analysis_timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Analyze a single CFM run and return a comprehensive report.
 
     Args:
         run_data: Parsed JSON from a CFM run output
+        analysis_timestamp: ISO timestamp to record for the analysis
+                            (defaults to now); lets one invocation stamp
+                            all of its reports alike
 
     Returns:
         Dict containing analysis results
@@ -127,9 +137,20 @@ def analyze_run(run_data: Dict[str, Any]) -> Dict[str, Any]:
     common_metrics = ["coherence", "stability", "intensity", "alignment"]
     stats = {}
 
+    # Validation totals over the common metrics, accumulated as they are computed
+    total_nan = 0
+    total_inf = 0
+    total_below_zero = 0
+    total_above_one = 0
+
     for metric in common_metrics:
         if metric in trajectories:
-            stats[metric] = compute_stats(trajectories[metric])
+            metric_stats = compute_stats(trajectories[metric])
+            stats[metric] = metric_stats
+            total_nan += metric_stats["nan_count"]
+            total_inf += metric_stats["inf_count"]
+            total_below_zero += metric_stats["below_zero"]
+            total_above_one += metric_stats["above_one"]
 
     # Detect core-specific fields (any trajectory key not in common_metrics)
     core_specific_stats = {}
@@ -137,11 +158,6 @@ def analyze_run(run_data: Dict[str, Any]) -> Dict[str, Any]:
         if key not in common_metrics:
             core_specific_stats[key] = compute_stats(trajectories[key])
 
-    # Aggregate validation
-    total_nan = sum(s.get("nan_count", 0) for s in stats.values())
-    total_inf = sum(s.get("inf_count", 0) for s in stats.values())
-    total_below_zero = sum(s.get("below_zero", 0) for s in stats.values())
-    total_above_one = sum(s.get("above_one", 0) for s in stats.values())
     all_bounded = total_nan == 0 and total_inf == 0 and total_below_zero == 0 and total_above_one == 0
 
     return {
@@ -164,121 +180,165 @@ def analyze_run(run_data: Dict[str, Any]) -> Dict[str, Any]:
             "all_bounded": all_bounded,
             "source_validation": validation,
         },
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": (
+            analysis_timestamp if analysis_timestamp is not None else datetime.now().isoformat()
+        ),
     }
 
 
-def format_text_report(analysis: Dict[str, Any], filename: str = "") -> str:
-    """Format analysis as human-readable text report."""
-    lines = []
-    lines.append("=" * 60)
-    lines.append("CFM LOG ANALYSIS REPORT")
-    lines.append("=" * 60)
+# Metric table layout: name, then mean/std/min/max columns
+_METRIC_ROW = "{:<12} {:>10.6f} {:>10.6f} {:>10.6f} {:>10.6f}"
+_METRIC_LABEL_ROW = "{:<12} {:>10} {:>10} {:>10} {:>10}"
+_METRIC_HEADER = _METRIC_LABEL_ROW.format("Metric", "Mean", "Std", "Min", "Max")
+
+
+def _format_metric_rows(metrics: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Format one metric table row per entry (N/A when no valid values)."""
+    return [
+        _METRIC_ROW.format(metric, stats["mean"], stats["std"], stats["min"], stats["max"])
+        if stats["mean"] is not None
+        else _METRIC_LABEL_ROW.format(metric, "N/A", "N/A", "N/A", "N/A")
+        for metric, stats in metrics.items()
+    ]
+
+
+def write_text_report(analysis: Dict[str, Any], writer: TextIO, filename: str = "") -> None:
+    """
+    Write analysis as human-readable text report.
+
+    Lines go straight to writer (any text stream); like
+    format_text_report(), the report ends without a trailing newline.
+    """
+    write = writer.write
+
+    def emit(line: str) -> None:
+        write(line + "\n")
+
+    emit("=" * 60)
+    emit("CFM LOG ANALYSIS REPORT")
+    emit("=" * 60)
 
     if filename:
-        lines.append(f"File: {filename}")
-    lines.append(f"Analysis time: {analysis['analysis_timestamp']}")
-    lines.append("")
+        emit(f"File: {filename}")
+    emit(f"Analysis time: {analysis['analysis_timestamp']}")
+    emit("")
 
     # Metadata
     meta = analysis["metadata"]
-    lines.append("METADATA")
-    lines.append("-" * 40)
-    lines.append(f"  Core type:    {meta['core_type']}")
-    lines.append(f"  Scenario:     {meta['scenario']}")
-    lines.append(f"  Steps:        {meta['num_steps']}")
-    lines.append(f"  dt:           {meta['dt']}")
-    lines.append(f"  Seed:         {meta['seed']}")
-    lines.append(f"  Timestamp:    {meta['timestamp']}")
-    lines.append("")
+    emit("METADATA")
+    emit("-" * 40)
+    emit(f"  Core type:    {meta['core_type']}")
+    emit(f"  Scenario:     {meta['scenario']}")
+    emit(f"  Steps:        {meta['num_steps']}")
+    emit(f"  dt:           {meta['dt']}")
+    emit(f"  Seed:         {meta['seed']}")
+    emit(f"  Timestamp:    {meta['timestamp']}")
+    emit("")
 
     # Common metrics
-    lines.append("COMMON METRICS (coherence, stability, intensity, alignment)")
-    lines.append("-" * 40)
-    lines.append(f"{'Metric':<12} {'Mean':>10} {'Std':>10} {'Min':>10} {'Max':>10}")
-    lines.append("-" * 54)
-
-    for metric, stats in analysis["common_metrics"].items():
-        if stats["mean"] is not None:
-            lines.append(
-                f"{metric:<12} {stats['mean']:>10.6f} {stats['std']:>10.6f} "
-                f"{stats['min']:>10.6f} {stats['max']:>10.6f}"
-            )
-        else:
-            lines.append(f"{metric:<12} {'N/A':>10} {'N/A':>10} {'N/A':>10} {'N/A':>10}")
-    lines.append("")
+    emit("COMMON METRICS (coherence, stability, intensity, alignment)")
+    emit("-" * 40)
+    emit(_METRIC_HEADER)
+    emit("-" * 54)
+    for row in _format_metric_rows(analysis["common_metrics"]):
+        emit(row)
+    emit("")
 
     # Core-specific metrics (if any)
     if analysis["core_specific_metrics"]:
-        lines.append("CORE-SPECIFIC METRICS")
-        lines.append("-" * 40)
-        lines.append(f"{'Metric':<12} {'Mean':>10} {'Std':>10} {'Min':>10} {'Max':>10}")
-        lines.append("-" * 54)
-        for metric, stats in analysis["core_specific_metrics"].items():
-            if stats["mean"] is not None:
-                lines.append(
-                    f"{metric:<12} {stats['mean']:>10.6f} {stats['std']:>10.6f} "
-                    f"{stats['min']:>10.6f} {stats['max']:>10.6f}"
-                )
-            else:
-                lines.append(f"{metric:<12} {'N/A':>10} {'N/A':>10} {'N/A':>10} {'N/A':>10}")
-        lines.append("")
+        emit("CORE-SPECIFIC METRICS")
+        emit("-" * 40)
+        emit(_METRIC_HEADER)
+        emit("-" * 54)
+        for row in _format_metric_rows(analysis["core_specific_metrics"]):
+            emit(row)
+        emit("")
 
     # Final state
     if analysis["final_state"]:
-        lines.append("FINAL STATE")
-        lines.append("-" * 40)
+        emit("FINAL STATE")
+        emit("-" * 40)
         for key, value in analysis["final_state"].items():
             if isinstance(value, float):
-                lines.append(f"  {key}: {value:.6f}")
+                emit(f"  {key}: {value:.6f}")
             else:
-                lines.append(f"  {key}: {value}")
-        lines.append("")
+                emit(f"  {key}: {value}")
+        emit("")
 
     # Validation
     val = analysis["validation"]
-    lines.append("VALIDATION")
-    lines.append("-" * 40)
+    emit("VALIDATION")
+    emit("-" * 40)
     status = "PASS" if val["all_bounded"] else "FAIL"
-    lines.append(f"  Bounded [0,1]: {status}")
-    lines.append(f"  NaN values:    {val['total_nan']}")
-    lines.append(f"  Inf values:    {val['total_inf']}")
-    lines.append(f"  Below 0:       {val['total_below_zero']}")
-    lines.append(f"  Above 1:       {val['total_above_one']}")
-    lines.append("")
-    lines.append("=" * 60)
+    emit(f"  Bounded [0,1]: {status}")
+    emit(f"  NaN values:    {val['total_nan']}")
+    emit(f"  Inf values:    {val['total_inf']}")
+    emit(f"  Below 0:       {val['total_below_zero']}")
+    emit(f"  Above 1:       {val['total_above_one']}")
+    emit("")
+    write("=" * 60)
+
 
-    return "\n".join(lines)
+def format_text_report(analysis: Dict[str, Any], filename: str = "") -> str:
+    """Format analysis as human-readable text report."""
+    buffer = io.StringIO()
+    write_text_report(analysis, buffer, filename)
+    return buffer.getvalue()
+
+
+def write_text_reports(analyses: List[Tuple[str, Dict[str, Any]]], writer: TextIO) -> None:
+    """Write text reports for several analyses, separated by a blank line."""
+    for index, (filename, analysis) in enumerate(analyses):
+        if index:
+            writer.write("\n\n")
+        write_text_report(analysis, writer, filename)
 
 
 def format_summary(analyses: List[Tuple[str, Dict[str, Any]]]) -> str:
     """Format a summary of multiple analyses."""
-    lines = []
-    lines.append("=" * 70)
-    lines.append("CFM MULTI-RUN SUMMARY")
-    lines.append("=" * 70)
-    lines.append(f"Total files analyzed: {len(analyses)}")
-    lines.append("")
-
-    # Header
-    lines.append(f"{'File':<30} {'Core':<8} {'Steps':>8} {'Bounded':>8}")
-    lines.append("-" * 70)
-
-    pass_count = 0
-    for filename, analysis in analyses:
-        short_name = os.path.basename(filename)[:28]
-        core_type = analysis["metadata"]["core_type"][:6]
-        steps = analysis["metadata"]["num_steps"]
-        bounded = "PASS" if analysis["validation"]["all_bounded"] else "FAIL"
-        if bounded == "PASS":
-            pass_count += 1
-        lines.append(f"{short_name:<30} {core_type:<8} {steps:>8} {bounded:>8}")
-
-    lines.append("")
-    lines.append(f"Passed: {pass_count}/{len(analyses)}")
-    lines.append("=" * 70)
-
-    return "\n".join(lines)
+    pass_count = sum(1 for _, analysis in analyses if analysis["validation"]["all_bounded"])
+
+    header = (
+        "=" * 70,
+        "CFM MULTI-RUN SUMMARY",
+        "=" * 70,
+        f"Total files analyzed: {len(analyses)}",
+        "",
+        f"{'File':<30} {'Core':<8} {'Steps':>8} {'Bounded':>8}",
+        "-" * 70,
+    )
+    rows = (
+        f"{os.path.basename(filename)[:28]:<30} "
+        f"{analysis['metadata']['core_type'][:6]:<8} "
+        f"{analysis['metadata']['num_steps']:>8} "
+        f"{('PASS' if analysis['validation']['all_bounded'] else 'FAIL'):>8}"
+        for filename, analysis in analyses
+    )
+    footer = (
+        "",
+        f"Passed: {pass_count}/{len(analyses)}",
+        "=" * 70,
+    )
+
+    return "\n".join(chain(header, rows, footer))
+
+
+def load_and_analyze(
+    input_file: str,
+    analysis_timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Load a CFM run JSON file and analyze it (see analyze_run).
+
+    Module-level so that it can run in worker processes.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(input_file, "r") as f:
+        run_data = json.load(f)
+    return analyze_run(run_data, analysis_timestamp)
 
 
 # ==============================================================================
@@ -295,6 +355,7 @@ Examples:
   python tools/cfm_log_analyzer.py --input out.json
   python tools/cfm_log_analyzer.py --input out.json --format json
   python tools/cfm_log_analyzer.py --input run1.json run2.json --summary
+  python tools/cfm_log_analyzer.py --input runs/*.json --summary --jobs 0
   python tools/cfm_log_analyzer.py --input out.json --output report.txt
         """
     )
@@ -334,29 +395,63 @@ Examples:
         help="Suppress progress messages",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for multiple input files (0 = one per CPU; default: 1)",
+    )
+
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (one per CPU) or a positive worker count")
     verbose = not args.quiet
 
     analyses = []
 
-    for input_file in args.input:
-        if verbose and len(args.input) > 1:
-            print(f"Analyzing: {input_file}", file=sys.stderr)
-
-        try:
-            with open(input_file, "r") as f:
-                run_data = json.load(f)
-        except FileNotFoundError:
-            print(f"Error: File not found: {input_file}", file=sys.stderr)
-            sys.exit(1)
-        except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in {input_file}: {e}", file=sys.stderr)
-            sys.exit(1)
-
-        analysis = analyze_run(run_data)
-        analyses.append((input_file, analysis))
-
-    # Format output
+    # Files are independent, so several can be analyzed in parallel;
+    # results are still collected (and reported) in input order
+    jobs = args.jobs or (os.cpu_count() or 1)
+    analyze_file = partial(load_and_analyze, analysis_timestamp=datetime.now().isoformat())
+    executor = None
+    futures = []
+    if jobs > 1 and len(args.input) > 1:
+        workers = min(jobs, len(args.input))
+        if verbose:
+            print(f"Analyzing {len(args.input)} files with {workers} worker processes",
+                  file=sys.stderr)
+        executor = ProcessPoolExecutor(max_workers=workers)
+        futures = [executor.submit(analyze_file, input_file) for input_file in args.input]
+        results = (future.result() for future in futures)
+    else:
+        results = map(analyze_file, args.input)
+
+    try:
+        for input_file in args.input:
+            if verbose and executor is None and len(args.input) > 1:
+                print(f"Analyzing: {input_file}", file=sys.stderr)
+
+            try:
+                analysis = next(results)
+            except FileNotFoundError:
+                print(f"Error: File not found: {input_file}", file=sys.stderr)
+                sys.exit(1)
+            except json.JSONDecodeError as e:
+                print(f"Error: Invalid JSON in {input_file}: {e}", file=sys.stderr)
+                sys.exit(1)
+
+            analyses.append((input_file, analysis))
+    finally:
+        if executor is not None:
+            # On an early exit, drop the files no worker has started yet
+            # (shutdown(cancel_futures=True) needs Python 3.9)
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+
+    # Format output; full text reports are written straight to the
+    # destination instead (output stays None)
+    output = None
     if args.summary and len(analyses) > 1:
         output = format_summary(analyses)
     elif args.format == "json":
@@ -364,16 +459,19 @@ Examples:
             output = json.dumps(analyses[0][1], indent=2)
         else:
             output = json.dumps([a[1] for a in analyses], indent=2)
-    else:
-        reports = [format_text_report(a, f) for f, a in analyses]
-        output = "\n\n".join(reports)
 
     # Write output
     if args.output:
         with open(args.output, "w") as f:
-            f.write(output)
+            if output is None:
+                write_text_reports(analyses, f)
+            else:
+                f.write(output)
         if verbose:
             print(f"Report saved to: {args.output}", file=sys.stderr)
+    elif output is None:
+        write_text_reports(analyses, sys.stdout)
+        sys.stdout.write("\n")
     else:
         print(output)
 